@@ -2,16 +2,18 @@ from collections import namedtuple
 from datetime import datetime as dt
 from time import sleep
 
-import altair as alt
-from numpy import pi
-import pandas as pd
 import streamlit as st
 
+from background import EXECUTOR, BackgroundJob
+from cache import SIMULATION_CACHE
+from charts import *
 from checks import remote_mining_bug_active
-from enums import MiningStatus as MS
+from constants import MAX_TIME
 from formatters import format_duration
+from lookup import LOOKUP_TABLE
 from simulation import *
-from strategies import ContinuousMining
+from strategies import BASE_STATE_CACHE, ContinuousMining
+from upgrades import rank_upgrades
 
 
 VERSION = "0.5.0 (Beta)"
@@ -56,7 +58,10 @@ module_inputs = [
 ]
 
 def change_mod_levels():
-    pass
+    # A simulation of the old levels is no longer wanted
+    if st.session_state.get("Job") is not None:
+        st.session_state["Job"].cancel()
+        st.session_state["Job"] = None
 
 module_values = [None for _ in module_inputs]
 
@@ -100,11 +105,13 @@ with right:
 
 ### Advanced Inputs
 default("Remote Mining Bug Delay", 0)
+default("Profile", False)
 with st.expander("Advanced Settings"):
     st.session_state["Simulation Tick Length"] = st.select_slider(
         "Simulation Tick Length (seconds)",
         options=[5, 10, 20],
-        value=10
+        value=10,
+        on_change=change_mod_levels,
     )
     st.session_state["Enrich Cooldown Delay"] = st.select_slider(
         "Extra delay between enrich cycles (seconds)",
@@ -113,6 +120,7 @@ with st.expander("Advanced Settings"):
             for i in range(5)
         ],
         value=st.session_state["Simulation Tick Length"],
+        on_change=change_mod_levels,
     )
     st.session_state["Remote Mining Bug Delay"] = st.select_slider(
         (
@@ -128,25 +136,86 @@ with st.expander("Advanced Settings"):
             st.session_state["Miner Level"],
             st.session_state["Artifact Boost"]
         ),
+        on_change=change_mod_levels,
     )
     st.session_state["Exit Duration"] = st.select_slider(
         "Time required to fly miners out of DRS (seconds)",
         options=list(range(
             60, 121, st.session_state["Simulation Tick Length"]
         )),
-        value=80
+        value=80,
+        on_change=change_mod_levels,
     )
+    st.session_state["Seed"] = st.number_input(
+        "Random seed for the starting hydro field",
+        min_value=0, step=1, format="%d", value=0,
+        on_change=change_mod_levels,
+    )
+    st.session_state["Debug"] = st.toggle(
+        "Show debug information (simulations bypass the cache)"
+    )
+    if st.session_state["Debug"]:
+        st.session_state["Profile"] = st.toggle(
+            "Profile simulation time and memory (slower)"
+        )
+        if st.session_state.get("Simulation") is not None:
+            st.json({
+                "Simulation": st.session_state["Simulation"].get_stats(),
+                "Cache": SIMULATION_CACHE.stats(),
+                "Base State Cache": BASE_STATE_CACHE.stats(),
+            }, expanded=False)
 
 
 ### Simulation Setup
 default("DRS Time", 0)
 default("Simulation", None)
 default("Inputs", None)
+default("Frames", None)
+default("Upgrades", None)
+default("Plans", None)
+default("Job", None)
+
+def run_simulation(inputs: UserInput,
+                   debug: bool,
+                   profile: bool,
+                   **watch) -> tuple[UserInput, Simulation, FrameStore | None]:
+    # Runs in the background, so it must not touch the session state
+    if debug:
+        sim = (
+            Simulation(inputs)
+            .instrument(profile=profile, trace_memory=profile)
+            .set_strategy(ContinuousMining)
+            .run(**watch)
+        )
+    else:
+        # Precomputed builds only replay their known mining delay
+        summary = None if LOOKUP_TABLE is None else LOOKUP_TABLE.lookup(inputs)
+        if summary is None:
+            options = {}
+        elif summary["Valid"]:
+            options = {"mining_delay": summary["Mining Delay"]}
+        else:
+            options = None
+        if options is None:
+            # Known to fail, so it is left as a failed run without running
+            sim = Simulation(inputs).set_strategy(ContinuousMining)
+        else:
+            sim = SIMULATION_CACHE.run(
+                inputs, ContinuousMining, **watch, **options
+            )
+    with sim.instrumentation.phase("Charts"):
+        frames = FrameStore(sim.read_results()) if sim.valid else None
+    return inputs, sim, frames
+
+def cancel_simulation() -> None:
+    if st.session_state["Job"] is not None:
+        st.session_state["Job"].cancel()
+    st.session_state["Job"] = None
 
 def get_simulation() -> None:
     if any([st.session_state[mod.name] is None for mod in module_inputs]):
         return
-    st.session_state["Inputs"] = UserInput(
+    inputs = UserInput(
         drslv=st.session_state["DRS Level"],
         genlv=st.session_state["Genesis"],
         enrlv=st.session_state["Enrich"],
@@ -161,186 +230,63 @@ def get_simulation() -> None:
         tick_len=st.session_state["Simulation Tick Length"],
         _rmbug_lag=st.session_state["Remote Mining Bug Delay"],
         exit_dur=st.session_state["Exit Duration"],
+        seed=st.session_state["Seed"],
     )
-    st.session_state["Simulation"] = (
-        Simulation(st.session_state["Inputs"])
-        .set_strategy(ContinuousMining)
-        .run()
-    )
-
-def make_linechart(mining_progress, duration):
-    tick_values = [
-        dur for dur in mining_progress["Duration"]
-        if dur[-3:] == "00s"
-    ]
-    line = (
-        alt.Chart(mining_progress[["Duration", "Total Hydro"]])
-        .mark_line()
-        .encode(
-            alt.X("Duration:O")
-                .axis(
-                    title="DRS Time (seconds)",
-                    grid=True,
-                    values=tick_values,
-                ),
-            alt.Y("Total Hydro")
-                .scale(domain=(0, 21000), nice=False)
-                .axis(title="Total Hydrogen in Sector")
-        )
-    )
-
-    max_hydro = (
-        alt.Chart(pd.DataFrame({"Max Hydro": [21000]}))
-        .mark_rule(color="red")
-        .encode(alt.Y("Max Hydro"))
-    )
-    cur_dur = (
-        alt.Chart(pd.DataFrame({"x": [duration]}))
-        .mark_rule(color="orange")
-        .encode(alt.X("x"))
-    )
-
-    mp_unique = mining_progress.drop_duplicates("Duration")
-    
-    rect = (
-        alt.Chart(mp_unique)
-        .mark_rect()
-        .encode(
-            x="Duration:O",
-            opacity=alt.value(0.2),
-            color=alt.Color("Mining Status:N", legend=None),
-        )
-    )
-
-    return line + rect + line + max_hydro + cur_dur
-
-def make_barchart(hydro_field, duration):
-    bar = (
-        alt.Chart(hydro_field[hydro_field["Duration"] == duration])
-        .mark_bar()
-        .encode(
-            alt.X("Roid")
-                .axis(labels=False, title="Asteroids in Sector"),
-            alt.Y("Hydro")
-                .scale(domain=(0, 1500), nice=False)
-                .axis(
-                    title="Hydrogen per Asteroid",
-                    values=[0, 300, 600, 900, 1200, 1500],
-                ),
-            color="Status",
-            opacity=alt.condition(
-                alt.datum.Active == True,
-                alt.value(1), alt.value(0.6)
-            )
-        )
-    )
-
-    rule = (
-        alt.Chart(pd.DataFrame({"Max Hydro": [1500]}))
-        .mark_rule(color="red")
-        .encode(alt.Y("Max Hydro"))
+    cancel_simulation()
+    st.session_state["Job"] = BackgroundJob(
+        run_simulation,
+        inputs,
+        st.session_state["Debug"],
+        st.session_state["Profile"],
     )
 
-    return bar + rule
-
-def make_donutchart(mining_progress, duration):
-    mp_unique = mining_progress.drop_duplicates("Time")
-    time = mp_unique.loc[mp_unique.Duration == duration, "Time"].values[0]
-
-    # Don't count the action at time 0
-    mp_unique = mp_unique[mp_unique["Time"] > 0]
-
-    # Count total and elapsed actions
-    all_actions = (
-        mp_unique
-        .value_counts("Mining Status")
-    ) * st.session_state["Simulation Tick Length"]
-    elapsed_actions = (
-        mp_unique[mp_unique["Time"] <= int(time)]
-        .value_counts("Mining Status")
-    ) * st.session_state["Simulation Tick Length"]
-
-    # Create df
-    index = pd.DataFrame(index=[ms.value for ms in MS])
-    source = (
-        pd.concat(
-            [index, all_actions, elapsed_actions],
-            axis=1,
-            ignore_index=True,
+def collect_simulation() -> None:
+    # Moves the results of a finished job into the session state
+    job: BackgroundJob = st.session_state["Job"]
+    if job is None or not job.done():
+        return
+    st.session_state["Job"] = None
+    result = job.result()
+    if result is None:
+        return
+    (
+        st.session_state["Inputs"],
+        st.session_state["Simulation"],
+        st.session_state["Frames"],
+    ) = result
+    st.session_state["Upgrades"] = None
+    st.session_state["Plans"] = None
+
+@st.fragment(run_every=0.2)
+def show_simulation_progress() -> None:
+    job: BackgroundJob = st.session_state["Job"]
+    if job is None or job.done():
+        st.rerun()
+    progress = job.progress
+    if progress is None:
+        st.progress(0, text="Setting up the hydro field")
+    else:
+        st.progress(
+            min(progress.time / MAX_TIME, 1.0),
+            text=(
+                f"Attempt {progress.attempts}: mining delay"
+                f" {format_duration(progress.mining_delay)},"
+                f" DRS time {format_duration(progress.time)}"
+            ),
         )
-        .reset_index()
-        .rename(columns={
-            "index": "Status",
-            0: "Total Duration (seconds)",
-            1: "Elapsed Duration (seconds)",
-        }, errors="raise")
-    )
+    st.button("Cancel", on_click=cancel_simulation)
 
-    innerRadius = 48
-    outerRadius = 144
-
-    source["Added Radius"] = (
-        source["Elapsed Duration (seconds)"]
-        / source["Total Duration (seconds)"]
-        * (outerRadius - innerRadius)
-    )
-    source = source.fillna(0)
-
-    # Create "base" chart showing total actions
-    donut = (
-        alt.Chart(source)
-        .mark_arc(innerRadius=innerRadius, outerRadius=outerRadius)
-        .encode(
-            theta=alt.Theta("Total Duration (seconds)", stack=True),
-            color="Status:N",
-            opacity=alt.value(0.3),
-        )
-        .properties(
-            title="Miner Time Spent Breakdown"
-        )
+def get_upgrades() -> None:
+    # On the shared threads, since forking the server isn't safe
+    st.session_state["Upgrades"] = rank_upgrades(
+        st.session_state["Inputs"], executor=EXECUTOR
     )
 
-    # Problem: cannot control radii of each slice individually
-    # Solution: create n additional donut charts on top of the "base" chart,
-    #           each with only its slice visible. Control the radius of each
-    #           additional chart as desired
-    slices = []
-    for ms in MS:
-        added_radius = (
-            source.loc[source["Status"] == ms.value, "Added Radius"].values[0]
-        )
-        donut_slice = (
-            alt.Chart(source)
-            .mark_arc(
-                innerRadius=innerRadius,
-                outerRadius=innerRadius + added_radius
-            )
-            .encode(
-                theta=alt.Theta("Total Duration (seconds)", stack=True),
-                color="Status:N",
-                opacity=alt.condition(
-                    alt.datum.Status == ms.value,
-                    alt.value(1), alt.value(0)
-                ),
-                tooltip=[
-                    "Total Duration (seconds)",
-                    "Elapsed Duration (seconds)",
-                    "Status",
-                ],
-            )
-        )
-        slices.append(donut_slice)
-
-    # Stack charts and configure
-    layer = (
-        alt.layer(donut, *slices)
-        .configure_title(anchor="middle")
-        .configure_legend(offset=-50, labelLimit=0, symbolOpacity=1)
+def get_plans() -> None:
+    st.session_state["Plans"] = (
+        Simulation(st.session_state["Inputs"]).optimize_genrich()
     )
 
-    return layer
-
-
 ### Button
 left_padding, center, right_padding = st.columns([3, 2, 3])
 with center:
@@ -353,6 +299,10 @@ with center:
     )
     st.write("")
 
+collect_simulation()
+if st.session_state["Job"] is not None:
+    show_simulation_progress()
+
 st.warning(
     "Warning: Crunch is currently unsupported by the mining simulation",
     icon="⚠️",
@@ -365,7 +315,7 @@ inputs: UserInput = st.session_state["Inputs"]
 ### Output
 if sim is not None and inputs is not None and sim.valid:
     mining_progress = sim.read_mining_progress_data()
-    hydro_field = sim.read_hydro_field_data()
+    frames: FrameStore = st.session_state["Frames"]
 
     with st.expander("Initial conditions"):
         st.markdown(f"""
@@ -405,7 +355,7 @@ if sim is not None and inputs is not None and sim.valid:
     )
 
     time_min = 0
-    time_max = mining_progress["Time"].values[-1]
+    time_max = frames.time_max
 
     tab1, tab2 = st.tabs(["Interactive Graphs", "Animated Graphs"])
 
@@ -414,20 +364,21 @@ if sim is not None and inputs is not None and sim.valid:
         with slider_col:
             st.session_state["DRS Time"] = st.select_slider(
                 "DRS Time (seconds)",
-                options=list(dict.fromkeys(mining_progress["Duration"])),
+                options=frames.times.tolist(),
+                format_func=format_duration,
                 key="slider"
             )
 
-        st.altair_chart(
-            make_linechart(mining_progress, st.session_state["DRS Time"]),
+        st.vega_lite_chart(
+            frames.linechart(st.session_state["DRS Time"]),
             use_container_width=True,
         )
-        st.altair_chart(
-            make_barchart(hydro_field, st.session_state["DRS Time"]),
+        st.vega_lite_chart(
+            frames.barchart(st.session_state["DRS Time"]),
             use_container_width=True,
         )
-        st.altair_chart(
-            make_donutchart(mining_progress, st.session_state["DRS Time"]),
+        st.vega_lite_chart(
+            frames.donutchart(st.session_state["DRS Time"]),
             use_container_width=True,
         )
     
@@ -442,36 +393,36 @@ if sim is not None and inputs is not None and sim.valid:
                 0,
                 text=f"DRS Time: {format_duration(time_min)}",
             )
-        line = st.altair_chart(
-            make_linechart(mining_progress, format_duration(time_min)),
+        line = st.vega_lite_chart(
+            frames.linechart(time_min),
             use_container_width=True,
         )
-        bar = st.altair_chart(
-            make_barchart(hydro_field, format_duration(time_min)),
+        bar = st.vega_lite_chart(
+            frames.barchart(time_min),
             use_container_width=True,
         )
-        donut = st.altair_chart(
-            make_donutchart(mining_progress, format_duration(time_min)),
+        donut = st.vega_lite_chart(
+            frames.donutchart(time_min),
             use_container_width=True,
         )
 
         tick = st.session_state["Simulation Tick Length"]
         if play_fast or play_slow:
-            for time in range(time_min, time_max + tick, tick):
+            for time in frames.times.tolist():
                 pbar.progress(
                     time / time_max,
                     text = f"DRS Time: {format_duration(time)}"
                 )
-                line.altair_chart(
-                    make_linechart(mining_progress, format_duration(time)),
+                line.vega_lite_chart(
+                    frames.linechart(time),
                     use_container_width=True,
                 )
-                bar.altair_chart(
-                    make_barchart(hydro_field, format_duration(time)),
+                bar.vega_lite_chart(
+                    frames.barchart(time),
                     use_container_width=True,
                 )
-                donut.altair_chart(
-                    make_donutchart(mining_progress, format_duration(time)),
+                donut.vega_lite_chart(
+                    frames.donutchart(time),
                     use_container_width=True,
                 )
                 sleep(0 if play_fast else 0.02 * tick)
@@ -479,3 +430,55 @@ elif sim is not None and inputs is not None:
     st.error(
         "Simulation failed to find a solution, please verify your inputs!"
     )
+
+
+### Upgrades
+if sim is not None and inputs is not None:
+    with st.expander("What should I upgrade next?"):
+        st.button("Rank Upgrades", on_click=get_upgrades)
+        upgrades = st.session_state["Upgrades"]
+        if upgrades is not None:
+            st.caption(
+                "Each module or miner one level up, ranked by how much "
+                "sooner the last artifact boost is mined (seconds)"
+            )
+            st.dataframe(upgrades, hide_index=True)
+
+
+### First Genrich
+if sim is not None and inputs is not None:
+    with st.expander("When should I genrich?"):
+        st.button("Optimize First Genrich", on_click=get_plans)
+        plans: Simulation = st.session_state["Plans"]
+        if plans is not None and plans.get_best_plan() is None:
+            st.error("No first genrich minute reaches the target in time")
+        elif plans is not None:
+            best = plans.get_best_plan()
+            genrich_start = best.genrich_start_min * 60
+            st.info(
+                f"Genrich first at {format_duration(genrich_start)}"
+                f" and delay mining until {format_duration(best.mining_delay)}"
+                f" after 2nd genrich to reach the jump gate at"
+                f" {format_duration(best.exit_time)} DRS time",
+                icon=":material/star:"
+            )
+            st.caption(
+                "Each first genrich minute, and the earliest the jump gate is "
+                "reached starting then"
+            )
+            st.dataframe(
+                [
+                    {
+                        "First Genrich": format_duration(
+                            plan.genrich_start_min * 60
+                        ),
+                        "Mining Delay": format_duration(plan.mining_delay),
+                        "Last Boost Time": format_duration(
+                            plan.last_boost_time
+                        ),
+                        "Exit Time": format_duration(plan.exit_time),
+                    }
+                    for plan in plans.get_pareto_frontier()
+                ],
+                hide_index=True,
+            )
@@ -0,0 +1,46 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from typing import Any
+
+from strategies import SearchProgress, SimulationCancelled
+
+
+class BackgroundJob:
+    # A simulation run on the shared executor. The job is given progress and
+    #   cancel keyword arguments for MiningStrategy.watch, and its progress
+    #   can be read at any time. Once cancelled, it stops at its next tick.
+    def __init__(self, job: Callable[..., Any], *args, **kwargs) -> None:
+        self.progress: SearchProgress | None = None
+        self._cancel = Event()
+        self._future = EXECUTOR.submit(
+            job, *args, progress=self._report, cancel=self._cancel, **kwargs
+        )
+
+    def _report(self, progress: SearchProgress) -> None:
+        self.progress = progress
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+        self._future.cancel()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self) -> Any:
+        # None once cancelled, otherwise waits for the job and returns what
+        #   it returned or raises what it raised
+        if self.cancelled:
+            return None
+        try:
+            return self._future.result()
+        except SimulationCancelled:
+            return None
+
+
+# Shared by every session of the app
+EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="simulation")
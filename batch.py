@@ -0,0 +1,282 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Self
+
+import numpy as np
+
+from constants import *
+from enums import AttemptOutcome as AO
+from strategies import HydroField
+from userinput import UserInput
+
+if TYPE_CHECKING:
+    from pandas import DataFrame as df
+
+
+# Outcome codes are positions in AttemptOutcome
+OUTCOMES = list(AO)
+RUNNING = -1
+SUCCESS = OUTCOMES.index(AO.SUCCESS)
+DRAINED = OUTCOMES.index(AO.DRAINED)
+TIMEOUT = OUTCOMES.index(AO.TIMEOUT)
+
+
+class FieldBatch:
+    # HydroField for many lanes at once, with one row per lane
+    def __init__(self, roids: np.ndarray) -> None:
+        self._roids = np.array(roids, dtype=float)
+        self._collected = np.zeros_like(self._roids)
+        self._gen_counter = 0
+
+    @classmethod
+    def from_fields(cls, fields: Iterable[HydroField]) -> Self:
+        # The fields must have had the same number of genesis
+        fields = list(fields)
+        new_fb = cls(np.stack([hf.roids for hf in fields]))
+        new_fb._gen_counter = fields[0].gen_counter
+        return new_fb
+
+    def take(self, lanes: np.ndarray) -> Self:
+        new_fb = FieldBatch.__new__(FieldBatch)
+        new_fb._roids = self._roids[lanes]
+        new_fb._collected = self._collected[lanes]
+        new_fb._gen_counter = self._gen_counter
+        return new_fb
+
+    def genrich(self, gen_amt: int, enr_mult: float) -> None:
+        # Genesis
+        new_roid_amt = gen_amt // GENESIS_ROIDS
+        cur_roids = START_ROIDS + self._gen_counter
+        if cur_roids < MAX_ROIDS:
+            new_roids = min(GENESIS_ROIDS, MAX_ROIDS - cur_roids)
+            self._roids[:, cur_roids:cur_roids+new_roids] = new_roid_amt
+            self._gen_counter += new_roids
+        # Enrich
+        np.multiply(self._roids, enr_mult, out=self._roids)
+        np.floor(self._roids, out=self._roids)
+        np.minimum(self._roids, H_MAX, out=self._roids)
+        self._collected[:] = 0
+
+    def rm_targets(self, count: int, lanes: np.ndarray) -> np.ndarray:
+        # Mask of the largest asteroids in each lane, ties broken by position
+        order = np.argsort(-self._roids[lanes], axis=1, kind="stable")
+        targets = np.zeros(order.shape, dtype=bool)
+        np.put_along_axis(targets, order[:, :count], True, axis=1)
+        return targets
+
+    def collect(self, amt_per_roid: np.ndarray, targets: np.ndarray) -> None:
+        mined = np.where(
+            targets, np.minimum(self._roids, amt_per_roid[:, None]), 0
+        )
+        self._collected += mined
+        self._roids -= mined
+
+    def drained_roids(self) -> np.ndarray:
+        if self._gen_counter < MAX_ROIDS - START_ROIDS:
+            return np.zeros(len(self._roids), dtype=bool)
+        return self._roids.min(axis=1) == 0
+
+
+class BatchMining:
+    # ContinuousMining attempts stepped in lockstep over many lanes. Lanes
+    #   share the inputs and the clock but have their own field and delay.
+    #   Fields are starting fields, or base fields as of base_time.
+    def __init__(self,
+                 inputs: UserInput,
+                 fields: FieldBatch,
+                 base_time: int | None = None) -> None:
+        self._inputs = inputs
+        self._max_time = MAX_TIME
+        self._base_fb = fields
+        self._base_time = base_time
+        if base_time is None:
+            self._base_field_setup()
+
+    @property
+    def base_time(self) -> int:
+        return self._base_time
+
+    def _tick_at(self, time: int) -> int:
+        # First tick at or after the given time
+        return -(-time // self._inputs.tick_len) * self._inputs.tick_len
+
+    def _base_field_setup(self) -> None:
+        inputs = self._inputs
+        self._base_time = max(
+            self._tick_at(inputs.genrich_start),
+            self._tick_at(inputs.genrich_start + inputs.genrich_cd),
+        )
+        for _ in range(2):
+            self._base_fb.genrich(inputs.gen, inputs.enr)
+
+    def attempt(self,
+                lanes: np.ndarray,
+                delays: np.ndarray,
+                first_settled: bool = False,
+                bounds: np.ndarray | None = None,
+                ) -> tuple[np.ndarray, np.ndarray]:
+        # Outcome code and time of the last artifact boost for each lane.
+        #   With first_settled, lanes after the first one to succeed are
+        #   dropped and left RUNNING, since they can't change which one that
+        #   is. Likewise with bounds, lower bounds on each lane's success
+        #   time, lanes which can't succeed as early as one already has.
+        inputs = self._inputs
+        tick_len = inputs.tick_len
+        boost_amt = inputs.ab * inputs.minerqty
+        tank_max = inputs.tanksize * inputs.minerqty
+        rm_ready = inputs.rm_lag + 1
+        target_count = min(inputs.remote_max_targets, MAX_ROIDS)
+        hf = self._base_fb.take(lanes)
+        n = len(lanes)
+
+        time = self._base_time
+        last_genrich = self._base_time
+        mining_start = self._base_time + np.asarray(delays)
+        last_artboost = np.zeros(n, dtype=int)
+        tank = np.zeros(n)
+        boosts = np.zeros(n, dtype=int)
+        targets = hf.rm_targets(target_count, np.arange(n))
+        outcomes = np.full(n, RUNNING, dtype=np.int8)
+        completed = np.zeros(n, dtype=int)
+        active = np.ones(n, dtype=bool)
+
+        while time < self._max_time and active.any():
+            # Jump to the tick of the next event in any active lane
+            next_event = min(
+                np.where(
+                    tank >= boost_amt,
+                    time + tick_len,
+                    np.maximum(mining_start, last_artboost + rm_ready),
+                )[active].min(),
+                last_genrich + inputs.genrich_cd,
+                self._max_time,
+            )
+            time = max(time + tick_len, self._tick_at(next_event))
+            # Mine
+            mining = (
+                active
+                & (time >= mining_start)
+                & (time > last_artboost + inputs.rm_lag)
+            )
+            total_mined = np.where(
+                mining,
+                np.minimum(inputs.total_mining_speed, tank_max - tank),
+                0,
+            )
+            tank += total_mined
+            hf.collect(total_mined / target_count, targets)
+            # Boost and Move
+            boosted = active & (tank >= boost_amt)
+            if boosted.any():
+                tank[boosted] -= boost_amt
+                boosts[boosted] += inputs.minerqty
+                last_artboost[boosted] = time
+                targets[boosted] = hf.rm_targets(target_count, boosted)
+            # Enrich
+            if time >= last_genrich + inputs.genrich_cd:
+                hf.genrich(inputs.gen, inputs.enr)
+                last_genrich = time
+            # Checks
+            drained = active & hf.drained_roids()
+            outcomes[drained] = DRAINED
+            active &= ~drained
+            succeeded = active & (boosts >= inputs.boostqty)
+            outcomes[succeeded] = SUCCESS
+            completed[succeeded] = time
+            active &= ~succeeded
+            if first_settled and succeeded.any():
+                active[np.argmax(succeeded) + 1:] = False
+            if bounds is not None and succeeded.any():
+                active &= bounds <= time
+
+        # Exceeded max simulation time
+        outcomes[active] = TIMEOUT
+        return outcomes, completed
+
+
+class BatchSimulation:
+    # Monte Carlo over randomized starting fields, one seed per field. Use
+    #   seeds.spawn_seeds for independent fields; inputs.seed is ignored.
+    def __init__(self,
+                 inputs: UserInput,
+                 seeds: Iterable[int],
+                 window: int = 2) -> None:
+        self._inputs = inputs
+        self._seeds = np.array(list(seeds))
+        # Delays tried at once per field
+        self._window = window
+        self._outcomes = None
+        self._delays = None
+        self._completed = None
+        self.rounds = 0
+
+    @property
+    def valid(self) -> np.ndarray:
+        return self._outcomes == SUCCESS
+
+    def run(self) -> Self:
+        inputs = self._inputs
+        fields = FieldBatch.from_fields(
+            HydroField(
+                DRS_STARTING_HYDRO[inputs.drslv],
+                np.random.default_rng(seed),
+            )
+            for seed in self._seeds.tolist()
+        )
+        engine = BatchMining(inputs, fields)
+        delays = np.arange(0, 2 * inputs.genrich_cd, inputs.tick_len)
+        n = len(self._seeds)
+        # Every lane's first delay which does not drain an asteroid. Outcomes
+        #   need not be monotonic in the delay, so delays are tried in order,
+        #   a window of them at once for every lane still searching.
+        first = np.full(n, len(delays))
+        self._outcomes = np.full(n, DRAINED, dtype=np.int8)
+        self._completed = np.zeros(n, dtype=int)
+        for start in range(0, len(delays), self._window):
+            lanes = np.flatnonzero(first == len(delays))
+            if not len(lanes):
+                break
+            window = delays[start:start+self._window]
+            outcomes, completed = engine.attempt(
+                np.repeat(lanes, len(window)), np.tile(window, len(lanes))
+            )
+            settled = (outcomes != DRAINED).reshape(len(lanes), len(window))
+            found = settled.any(axis=1)
+            pos = settled.argmax(axis=1)[found]
+            flat = np.flatnonzero(found) * len(window) + pos
+            first[lanes[found]] = start + pos
+            self._outcomes[lanes[found]] = outcomes[flat]
+            self._completed[lanes[found]] = completed[flat]
+            self.rounds += 1
+        self._delays = np.append(delays, 2 * inputs.genrich_cd)[first]
+        return self
+
+    def read_results(self) -> "df":
+        from pandas import DataFrame as df
+        valid = self.valid
+        exit_ticks = -(-self._inputs.exit_dur // self._inputs.tick_len)
+        return df({
+            "Seed": self._seeds,
+            "Valid": valid,
+            "Outcome": np.array(OUTCOMES, dtype=object)[self._outcomes],
+            "Mining Delay": np.where(
+                valid, self._delays + self._inputs.tick_len, np.nan
+            ),
+            "Last Boost Time": np.where(valid, self._completed, np.nan),
+            "Exit Time": np.where(
+                valid,
+                self._completed + exit_ticks * self._inputs.tick_len,
+                np.nan,
+            ),
+        })
+
+    def summary(self) -> dict[str, float]:
+        results = self.read_results()
+        stats = {"Failure Rate": float(1 - results["Valid"].mean())}
+        for column in ["Mining Delay", "Last Boost Time", "Exit Time"]:
+            values = results.loc[results["Valid"], column]
+            for pct in [50, 90]:
+                stats[f"{column} p{pct}"] = (
+                    float(np.percentile(values, pct))
+                    if len(values) else np.nan
+                )
+        return stats
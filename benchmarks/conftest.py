@@ -0,0 +1,25 @@
+from dataclasses import replace
+
+import pytest
+
+from simulation import Simulation
+from strategies import ContinuousMining
+from tests.builds import BASE_BUILD
+from userinput import UserInput
+
+
+# DRS level and miner quantity of each representative build
+BENCHMARK_BUILDS = [(7, 1), (8, 2), (9, 3), (10, 2), (11, 3), (12, 4)]
+
+
+@pytest.fixture(
+    params=BENCHMARK_BUILDS, ids=lambda build: f"drs{build[0]}x{build[1]}"
+)
+def build(request) -> UserInput:
+    drslv, minerqty = request.param
+    return replace(BASE_BUILD, drslv=drslv, minerqty=minerqty)
+
+
+@pytest.fixture
+def finished() -> Simulation:
+    return Simulation(BASE_BUILD).set_strategy(ContinuousMining).run()
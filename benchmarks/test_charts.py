@@ -0,0 +1,22 @@
+import pytest
+
+from charts import FrameStore
+
+
+pytestmark = pytest.mark.benchmark(group="charts")
+
+
+@pytest.fixture
+def frames(finished) -> FrameStore:
+    return FrameStore(finished.read_results())
+
+
+def test_frame_store(benchmark, finished):
+    results = finished.read_results()
+    benchmark(FrameStore, results)
+
+
+@pytest.mark.parametrize("chart", ["linechart", "barchart", "donutchart"])
+def test_frame(benchmark, frames, chart):
+    time = int(frames.times[len(frames.times) // 2])
+    benchmark(getattr(frames, chart), time)
@@ -0,0 +1,21 @@
+import pytest
+
+
+pytestmark = pytest.mark.benchmark(group="export")
+
+
+def test_read_mining_progress_data(benchmark, finished):
+    benchmark(finished.read_mining_progress_data)
+
+
+def test_read_hydro_field_data(benchmark, finished):
+    benchmark(finished.read_hydro_field_data)
+
+
+def test_read_results(benchmark, finished):
+    benchmark(finished.read_results)
+
+
+def test_field_at(benchmark, finished):
+    results = finished.read_results()
+    benchmark(results.field_at, results.time_max // 2)
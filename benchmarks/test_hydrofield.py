@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from constants import DRS_STARTING_HYDRO
+from strategies import HydroField
+
+
+pytestmark = pytest.mark.benchmark(group="hydrofield")
+
+ROUNDS = 2000
+
+
+@pytest.fixture
+def field(build) -> HydroField:
+    # The field at the start of mining, after both genriches
+    hf = HydroField(
+        DRS_STARTING_HYDRO[build.drslv], np.random.default_rng(build.seed)
+    )
+    for _ in range(2):
+        hf.genrich(build.gen, build.enr)
+    return hf
+
+
+def test_genrich(benchmark, field, build):
+    benchmark.pedantic(
+        lambda hf: hf.genrich(build.gen, build.enr),
+        setup=lambda: ((field.copy(),), {}),
+        rounds=ROUNDS,
+    )
+
+
+def test_collect(benchmark, field, build):
+    targets = field.sort_rm_targets(build.remote_max_targets)
+    benchmark.pedantic(
+        lambda hf: hf.collect(build.total_mining_speed, targets),
+        setup=lambda: ((field.copy(),), {}),
+        rounds=ROUNDS,
+    )
+
+
+def test_sort_rm_targets(benchmark, field, build):
+    benchmark(field.sort_rm_targets, build.remote_max_targets)
+
+
+def test_copy(benchmark, field):
+    benchmark(field.copy)
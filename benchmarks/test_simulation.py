@@ -0,0 +1,34 @@
+from dataclasses import replace
+
+import pytest
+
+from enums import Recording
+from enums import SearchMethod as SM
+from simulation import Simulation
+from strategies import ContinuousMining
+
+
+pytestmark = pytest.mark.benchmark(group="simulation")
+
+
+@pytest.mark.parametrize("tick_len", [5, 10, 20])
+def test_run(benchmark, build, tick_len):
+    inputs = replace(build, tick_len=tick_len)
+    benchmark(
+        lambda: Simulation(inputs).set_strategy(ContinuousMining).run()
+    )
+
+
+@pytest.mark.parametrize("search_method", [SM.LINEAR, SM.BATCH])
+def test_run_untraced(benchmark, build, search_method):
+    benchmark(
+        lambda: (
+            Simulation(build)
+            .set_strategy(
+                ContinuousMining,
+                search_method=search_method,
+                recording=Recording.NONE,
+            )
+            .run()
+        )
+    )
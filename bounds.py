@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from constants import *
+from userinput import UserInput
+
+
+@dataclass(kw_only=True, frozen=True)
+class Bounds:
+    # Most hydro the miners could ever take from the field, most artifact
+    #   boosts they could reach, and the earliest time and longest mining
+    #   delay with which they could reach the target
+    max_hydro: float
+    max_boosts: int
+    earliest_completion: int
+    max_delay: int
+    feasible: bool
+
+
+def tick_at(time: int, tick_len: int) -> int:
+    # First tick at or after the given time
+    return -(-time // tick_len) * tick_len
+
+
+def base_time(inputs: UserInput) -> int:
+    # Time of the second genrich, when attempts start
+    return max(
+        tick_at(inputs.genrich_start, inputs.tick_len),
+        tick_at(inputs.genrich_start + inputs.genrich_cd, inputs.tick_len),
+    )
+
+
+def last_tick(inputs: UserInput) -> int:
+    # Latest time a tick can be simulated at
+    return MAX_TIME + inputs.tick_len - 1
+
+
+def required_hydro(inputs: UserInput) -> int:
+    # Miners boost together, so the target is reached in whole rounds
+    rounds = -(-inputs.boostqty // inputs.minerqty)
+    return rounds * inputs.ab * inputs.minerqty
+
+
+def max_hydro(inputs: UserInput) -> float:
+    # Nothing is mined before the second genrich, so the field holds at most
+    #   its starting hydro with two genriches. Each later enrich adds at most
+    #   H_MAX * (1 - 1/enr) to an asteroid, at any level below H_MAX.
+    enr = inputs.enr
+    roids = START_ROIDS
+    total = DRS_STARTING_HYDRO[inputs.drslv]
+    for _ in range(2):
+        new_roids = min(GENESIS_ROIDS, MAX_ROIDS - roids)
+        roids += new_roids
+        total = min(
+            (total + new_roids * (inputs.gen // GENESIS_ROIDS)) * enr,
+            roids * H_MAX,
+        )
+    enriches = 0
+    genrich = base_time(inputs)
+    while (
+        genrich := tick_at(genrich + inputs.genrich_cd, inputs.tick_len)
+    ) <= last_tick(inputs):
+        enriches += 1
+    return total + enriches * roids * H_MAX * (1 - 1 / enr)
+
+
+def earliest_completions(inputs: UserInput, delays: np.ndarray) -> np.ndarray:
+    # Lower bounds on the time of the last boost with each mining delay.
+    #   Miners boost at most once a tick, mine at most at full speed from
+    #   their first mining tick, and pause for the remote mining bug after
+    #   every boost but the last.
+    tick_len = inputs.tick_len
+    start = base_time(inputs)
+    rounds = -(-inputs.boostqty // inputs.minerqty)
+    hydro = required_hydro(inputs)
+    by_boosts = np.full(len(delays), start + rounds * tick_len)
+    if hydro == 0:
+        return by_boosts
+    if inputs.total_mining_speed <= 0:
+        return np.full(len(delays), np.inf)
+    ticks = max(1, int(np.ceil(hydro / inputs.total_mining_speed - 1e-9)))
+    first_tick = start + np.maximum(
+        tick_len, tick_at(np.asarray(delays), tick_len)
+    )
+    lag_ticks = (rounds - 1) * (inputs.rm_lag // tick_len)
+    return np.maximum(
+        by_boosts, first_tick + (ticks - 1 + lag_ticks) * tick_len
+    )
+
+
+def bounds(inputs: UserInput) -> Bounds:
+    # Computed from the game tables alone, without simulating a tick
+    tick_len = inputs.tick_len
+    delays = np.arange(0, 2 * inputs.genrich_cd, tick_len)
+    completions = earliest_completions(inputs, delays)
+    in_time = completions <= last_tick(inputs)
+    hydro = max_hydro(inputs)
+    ticks = (last_tick(inputs) - base_time(inputs)) // tick_len
+    boost_amt = inputs.ab * inputs.minerqty
+    if boost_amt == 0:
+        rounds = ticks
+    elif inputs.tanksize < inputs.ab:
+        # The tanks never hold enough for a boost
+        rounds = 0
+    else:
+        reachable = min(hydro, inputs.total_mining_speed * ticks)
+        rounds = min(ticks, int(np.floor(reachable / boost_amt + 1e-9)))
+    max_boosts = max(0, rounds) * inputs.minerqty
+    return Bounds(
+        max_hydro=hydro,
+        max_boosts=max_boosts,
+        earliest_completion=int(min(completions[0], np.iinfo(np.int32).max)),
+        max_delay=int(delays[in_time].max()) if in_time.any() else -1,
+        feasible=bool(in_time.any() and max_boosts >= inputs.boostqty),
+    )
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from hashlib import sha256
+from pathlib import Path
+from threading import Event, Lock
+
+import numpy as np
+
+from simulation import Simulation
+from strategies import MiningStrategy, SearchProgress
+from userinput import UserInput
+
+
+# Bump whenever a change to the engine changes results for the same key
+CACHE_VERSION = 5
+
+
+class SimulationCache:
+    # Finished simulations keyed on inputs (seed included), strategy and
+    #   options. The least recently used ones are evicted once their traces
+    #   exceed max_bytes, and are optionally kept as .npz files in cache_dir.
+    #   Safe to share between threads; simulations run outside the lock.
+    def __init__(self,
+                 max_bytes: int = 256 * 2**20,
+                 cache_dir: str | Path | None = None) -> None:
+        self._entries: OrderedDict[tuple, tuple[Simulation, int]] = (
+            OrderedDict()
+        )
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._cache_dir = None if cache_dir is None else Path(cache_dir)
+        self._lock = Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "Hits": self.hits,
+            "Disk Hits": self.disk_hits,
+            "Misses": self.misses,
+            "Hit Rate": self.hit_rate,
+            "Entries": len(self._entries),
+            "Bytes": self._bytes,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def run(self,
+            inputs: UserInput,
+            mining_strategy: type[MiningStrategy],
+            progress: Callable[[SearchProgress], None] | None = None,
+            cancel: Event | None = None,
+            **options) -> Simulation:
+        # progress and cancel only apply to simulations which are run, see
+        #   MiningStrategy.watch
+        if inputs.seed is None:
+            # Unseeded fields are random, so the result can't be reused
+            with self._lock:
+                self.misses += 1
+            return (
+                Simulation(inputs)
+                .set_strategy(mining_strategy, **options)
+                .run(progress, cancel)
+            )
+        key = (inputs, mining_strategy, tuple(sorted(options.items())))
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+        sim = Simulation(inputs).set_strategy(mining_strategy, **options)
+        arrays = self._load(key)
+        loaded = arrays is not None
+        if loaded:
+            sim.load_arrays(arrays)
+        else:
+            arrays = sim.run(progress, cancel).to_arrays()
+            self._save(key, arrays)
+        with self._lock:
+            if loaded:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+            return self._insert(
+                key, sim, sum(array.nbytes for array in arrays.values())
+            )
+
+    ### Storage components
+    def _insert(self,
+                key: tuple,
+                sim: Simulation,
+                nbytes: int) -> Simulation:
+        # The cached simulation, which is another thread's if it finished
+        #   the same key first. Called with the lock held.
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+        if nbytes > self._max_bytes:
+            return sim
+        self._entries[key] = (sim, nbytes)
+        self._bytes += nbytes
+        while self._bytes > self._max_bytes:
+            _, (_, evicted_bytes) = self._entries.popitem(last=False)
+            self._bytes -= evicted_bytes
+        return sim
+
+    def _path(self, key: tuple) -> Path:
+        digest = sha256(repr((CACHE_VERSION, *key)).encode()).hexdigest()
+        return self._cache_dir / f"{digest[:32]}.npz"
+
+    def _load(self, key: tuple) -> dict[str, np.ndarray] | None:
+        if self._cache_dir is None or not self._path(key).exists():
+            return None
+        with np.load(self._path(key)) as data:
+            return dict(data)
+
+    def _save(self, key: tuple, arrays: dict[str, np.ndarray]) -> None:
+        if self._cache_dir is None:
+            return
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        np.savez(self._path(key), **arrays)
+
+
+# Shared by every caller in the process
+SIMULATION_CACHE = SimulationCache()
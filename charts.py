@@ -0,0 +1,221 @@
+import altair as alt
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from enums import MiningStatus as MS
+from formatters import format_durations
+from results import SimulationResults
+
+
+INNER_RADIUS = 48
+OUTER_RADIUS = 144
+
+
+class FrameStore:
+    # Per-tick chart data of a simulation, looked up by DRS time in seconds
+    def __init__(self, results: SimulationResults) -> None:
+        self._results = results
+        self.times = results.times
+        self.durations = format_durations(self.times)
+        self._index = {time: i for i, time in enumerate(self.times.tolist())}
+        # Specs are compiled once, leaving the per-tick data as named datasets.
+        #   Their static datasets are serialized once too, but are still sent
+        #   to the browser with every frame
+        self._line_spec = vega_lite_spec(
+            make_linechart(results.progress_until())
+        )
+        self._bar_spec = vega_lite_spec(make_barchart())
+        self._donut_spec = vega_lite_spec(make_donutchart())
+
+    @property
+    def time_max(self) -> int:
+        return self._results.time_max
+
+    def duration(self, time: int) -> str:
+        return self.durations[self._index[time]]
+
+    def donut_data(self, time: int) -> pd.DataFrame:
+        source = self._results.status_breakdown(time).astype({
+            "Total Duration (seconds)": float,
+            "Elapsed Duration (seconds)": float,
+        })
+        with np.errstate(divide="ignore", invalid="ignore"):
+            source["Added Radius"] = np.nan_to_num(
+                source["Elapsed Duration (seconds)"]
+                / source["Total Duration (seconds)"]
+                * (OUTER_RADIUS - INNER_RADIUS)
+            )
+        return source
+
+    def linechart(self, time: int) -> dict:
+        spec = self._line_spec
+        time_df = pd.DataFrame({"x": [self.duration(time)]})
+        return spec | {"datasets": spec["datasets"] | {"time": time_df}}
+
+    def barchart(self, time: int) -> dict:
+        spec = self._bar_spec
+        field_df = self._results.field_at(time)
+        return spec | {"datasets": spec["datasets"] | {"field": field_df}}
+
+    def donutchart(self, time: int) -> dict:
+        spec = self._donut_spec
+        source = self.donut_data(time)
+        # Each status slice fills up to its share of elapsed time
+        layer = [spec["layer"][0]] + [
+            view | {"mark": view["mark"] | {
+                "outerRadius": INNER_RADIUS + added_radius
+            }}
+            for view, added_radius in zip(
+                spec["layer"][1:], source["Added Radius"].tolist()
+            )
+        ]
+        return spec | {
+            "layer": layer,
+            "datasets": spec["datasets"] | {"source": source},
+        }
+
+
+def vega_lite_spec(chart: alt.TopLevelMixin) -> dict:
+    # Compiled without the default theme, as st.altair_chart does. Inline
+    #   datasets become Arrow IPC bytes, which st.vega_lite_chart sends as is
+    with alt.theme.enable("none"):
+        spec = chart.to_dict()
+    return spec | {"datasets": {
+        name: arrow_bytes(records)
+        for name, records in spec.get("datasets", {}).items()
+    }}
+
+
+def arrow_bytes(records: list[dict]) -> bytes:
+    table = pa.Table.from_pylist(records)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def make_linechart(mining_progress):
+    tick_values = [
+        dur for dur in mining_progress["Duration"]
+        if dur[-3:] == "00s"
+    ]
+    line = (
+        alt.Chart(mining_progress[["Duration", "Total Hydro"]])
+        .mark_line()
+        .encode(
+            alt.X("Duration:O")
+                .axis(
+                    title="DRS Time (seconds)",
+                    grid=True,
+                    values=tick_values,
+                ),
+            alt.Y("Total Hydro")
+                .scale(domain=(0, 21000), nice=False)
+                .axis(title="Total Hydrogen in Sector")
+        )
+    )
+
+    max_hydro = (
+        alt.Chart(pd.DataFrame({"Max Hydro": [21000]}))
+        .mark_rule(color="red")
+        .encode(alt.Y("Max Hydro"))
+    )
+    cur_dur = (
+        alt.Chart(alt.NamedData("time"))
+        .mark_rule(color="orange")
+        .encode(alt.X("x:N"))
+    )
+
+    mp_unique = mining_progress.drop_duplicates("Duration")
+    
+    rect = (
+        alt.Chart(mp_unique)
+        .mark_rect()
+        .encode(
+            x="Duration:O",
+            opacity=alt.value(0.2),
+            color=alt.Color("Mining Status:N", legend=None),
+        )
+    )
+
+    return line + rect + line + max_hydro + cur_dur
+
+def make_barchart():
+    bar = (
+        alt.Chart(alt.NamedData("field"))
+        .mark_bar()
+        .encode(
+            alt.X("Roid:N")
+                .axis(labels=False, title="Asteroids in Sector"),
+            alt.Y("Hydro:Q")
+                .scale(domain=(0, 1500), nice=False)
+                .axis(
+                    title="Hydrogen per Asteroid",
+                    values=[0, 300, 600, 900, 1200, 1500],
+                ),
+            color="Status:N",
+            opacity=alt.condition(
+                alt.datum.Active == True,
+                alt.value(1), alt.value(0.6)
+            )
+        )
+    )
+
+    rule = (
+        alt.Chart(pd.DataFrame({"Max Hydro": [1500]}))
+        .mark_rule(color="red")
+        .encode(alt.Y("Max Hydro"))
+    )
+
+    return bar + rule
+
+def make_donutchart():
+    source = alt.NamedData("source")
+
+    # Create "base" chart showing total actions
+    donut = (
+        alt.Chart(source)
+        .mark_arc(innerRadius=INNER_RADIUS, outerRadius=OUTER_RADIUS)
+        .encode(
+            theta=alt.Theta("Total Duration (seconds):Q", stack=True),
+            color="Status:N",
+            opacity=alt.value(0.3),
+        )
+        .properties(
+            title="Miner Time Spent Breakdown"
+        )
+    )
+
+    # Problem: cannot control radii of each slice individually
+    # Solution: create n additional donut charts on top of the "base" chart,
+    #           each with only its slice visible. The radius of each
+    #           additional chart is set per frame by FrameStore.donutchart
+    slices = []
+    for ms in MS:
+        donut_slice = (
+            alt.Chart(source)
+            .mark_arc(innerRadius=INNER_RADIUS, outerRadius=INNER_RADIUS)
+            .encode(
+                theta=alt.Theta("Total Duration (seconds):Q", stack=True),
+                color="Status:N",
+                opacity=alt.condition(
+                    alt.datum.Status == ms.value,
+                    alt.value(1), alt.value(0)
+                ),
+                tooltip=[
+                    "Total Duration (seconds):Q",
+                    "Elapsed Duration (seconds):Q",
+                    "Status:N",
+                ],
+            )
+        )
+        slices.append(donut_slice)
+
+    # Stack charts and configure
+    layer = (
+        alt.layer(donut, *slices)
+        .configure_title(anchor="middle")
+        .configure_legend(offset=-50, labelLimit=0, symbolOpacity=1)
+    )
+
+    return layer
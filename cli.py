@@ -0,0 +1,91 @@
+import csv
+import json
+import sys
+from argparse import ArgumentParser, FileType
+from collections.abc import Iterator
+from dataclasses import asdict
+from typing import TextIO
+
+from sweep import iter_sweep, sweep_inputs
+from userinput import UserInput
+
+
+def parse_values(cell: str) -> list[int]:
+    # "12", "7-12" (inclusive) or "1|2|4"
+    values = []
+    for part in cell.split("|"):
+        start, _, stop = part.strip().partition("-")
+        values.extend(range(int(start), int(stop or start) + 1))
+    return values
+
+
+def read_ndjson(lines: TextIO) -> Iterator[UserInput]:
+    # One UserInput per line, as an object keyed by field name
+    for line in lines:
+        if line.strip():
+            yield UserInput(**json.loads(line))
+
+
+def read_csv(lines: TextIO) -> Iterator[UserInput]:
+    # One build per row, keyed by field name in the header. Cells may hold
+    #   several values, and every combination of them is run.
+    for row in csv.DictReader(lines):
+        ranges = {
+            name: parse_values(cell)
+            for name, cell in row.items() if cell.strip()
+        }
+        yield from sweep_inputs(UserInput(**{
+            name: values[0] for name, values in ranges.items()
+        }), ranges)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = ArgumentParser(
+        prog="python -m cli",
+        description=(
+            "Simulate builds without the app. Reads NDJSON or a CSV sweep "
+            "spec, writes one NDJSON result per build as it finishes."
+        ),
+    )
+    parser.add_argument(
+        "input", nargs="?", type=FileType("r"), default=sys.stdin,
+        help="NDJSON or CSV file, standard input by default",
+    )
+    parser.add_argument(
+        "--csv", action="store_true",
+        help="read the input as a CSV sweep spec (implied by .csv files)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="worker processes, 0 for one per CPU (default: 1)",
+    )
+    parser.add_argument(
+        "--stats", action="store_true",
+        help="add counters and phase timings to each result",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="add cProfile and tracemalloc reports, implies --stats",
+    )
+    args = parser.parse_args(argv)
+
+    reader = (
+        read_csv if args.csv or args.input.name.endswith(".csv")
+        else read_ndjson
+    )
+    try:
+        configs = list(reader(args.input))
+    except (TypeError, ValueError) as e:
+        parser.error(f"invalid build in {args.input.name}: {e}")
+    instrument = (
+        {"profile": args.profile, "trace_memory": args.profile}
+        if args.stats or args.profile else None
+    )
+    for inputs, summary in iter_sweep(
+        configs, max_workers=args.jobs or None, instrument=instrument
+    ):
+        print(json.dumps(asdict(inputs) | summary), flush=True)
+
+
+if __name__ == "__main__":
+    main()
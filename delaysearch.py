@@ -0,0 +1,67 @@
+from collections.abc import Callable, Sequence
+
+from enums import AttemptOutcome as AO
+from enums import SearchMethod as SM
+
+
+class DelaySearch:
+    # Finds the smallest mining delay whose attempt does not drain an
+    #   asteroid. Outcomes are not always monotonic in the delay, so every
+    #   delay below the result must have been tried and drained.
+    def __init__(self,
+                 attempt: Callable[[int], AO],
+                 delays: Sequence[int],
+                 method: SM = SM.LINEAR,
+                 attempt_all: Callable[[Sequence[int]], list[AO]] | None = None
+                 ) -> None:
+        # attempt_all runs every delay at once, for the batch method
+        self._attempt = attempt
+        self._attempt_all = attempt_all
+        self._delays = delays
+        self._method = method
+        self._outcomes: dict[int, AO] = {}
+        self.simulations = 0
+
+    def outcome(self, delay: int) -> AO:
+        if delay not in self._outcomes:
+            self._outcomes[delay] = self.replay(delay)
+        return self._outcomes[delay]
+
+    def replay(self, delay: int) -> AO:
+        self.simulations += 1
+        return self._attempt(delay)
+
+    def _settled(self, idx: int) -> bool:
+        return self.outcome(self._delays[idx]) != AO.DRAINED
+
+    def run(self) -> int | None:
+        n = len(self._delays)
+        match self._method:
+            case SM.LINEAR:
+                idx = self._linear(0, n)
+            case SM.BATCH:
+                idx = self._batch(n)
+        return self._delays[idx] if idx < n else None
+
+    ### Search components
+    def _linear(self, lo: int, hi: int) -> int:
+        for idx in range(lo, hi):
+            if self._settled(idx):
+                return idx
+        return hi
+
+    def _batch(self, n: int) -> int:
+        # Outcomes of the delays up to the first that settles, all at once
+        outcomes = self._attempt_all(self._delays)
+        self._outcomes.update(zip(self._delays, outcomes))
+        self.simulations += len(outcomes)
+        return self._first_settled_probe(n)
+
+    def _first_settled_probe(self, n: int) -> int:
+        return min(
+            (
+                idx for idx, delay in enumerate(self._delays)
+                if self._outcomes.get(delay, AO.DRAINED) != AO.DRAINED
+            ),
+            default=n,
+        )
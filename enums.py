@@ -7,3 +7,20 @@ class MiningStatus(StrEnum):
     MINING = "Mining the hydro sector(s)"
     WAITING = "Waiting to restart mining"
     EXITING = "Flying to jump gate"
+
+
+class AttemptOutcome(StrEnum):
+    SUCCESS = "Reached the target number of artifact boosts"
+    DRAINED = "Drained an asteroid before reaching the target"
+    TIMEOUT = "Exceeded the maximum simulation time"
+
+
+class SearchMethod(StrEnum):
+    LINEAR = "linear"
+    BATCH = "batch"
+
+
+class Recording(StrEnum):
+    NONE = "none"
+    SUMMARY = "summary"
+    FULL = "full"
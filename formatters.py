@@ -1,5 +1,15 @@
+import numpy as np
+
 from constants import MINUTE
 
 
 def format_duration(time_in_seconds):
     return f"{time_in_seconds//MINUTE:02}m {time_in_seconds%MINUTE:02}s"
+
+
+def format_durations(times_in_seconds: np.ndarray) -> np.ndarray:
+    # Formats each distinct time once
+    times, inverse = np.unique(times_in_seconds, return_inverse=True)
+    return np.array(
+        [format_duration(time) for time in times.tolist()], dtype=object
+    )[inverse]
@@ -0,0 +1,77 @@
+import json
+import subprocess
+import sys
+from argparse import ArgumentParser
+
+
+# Seconds each module may take to import in a fresh interpreter, numpy
+#   included. None of them may import the app's heavy dependencies.
+IMPORT_BUDGETS = {
+    "constants": 0.02,
+    "userinput": 0.05,
+    "strategies": 0.3,
+    "simulation": 0.3,
+    "sweep": 0.35,
+    "cli": 0.35,
+}
+HEAVY_MODULES = ["pandas", "streamlit", "altair"]
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    # Cumulative import time from -X importtime, and heavy modules loaded
+    proc = subprocess.run(
+        [
+            sys.executable, "-X", "importtime", "-c",
+            f"import sys, {module}; print(*sys.modules)",
+        ],
+        capture_output=True, text=True, check=True,
+    )
+    for line in proc.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            seconds = int(cumulative) / 1e6
+    loaded = set(proc.stdout.split())
+    return seconds, [heavy for heavy in HEAVY_MODULES if heavy in loaded]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = ArgumentParser(
+        prog="python -m importbudget",
+        description="Check the import time of the simulation core.",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="imports per module, the fastest is kept (default: 5)",
+    )
+    parser.add_argument(
+        "--json", action="store_true",
+        help="print the results as one JSON object for tracking",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module, budget in IMPORT_BUDGETS.items():
+        runs = [measure(module) for _ in range(args.repeat)]
+        seconds = min(seconds for seconds, _ in runs)
+        results[module] = {
+            "Seconds": seconds,
+            "Budget": budget,
+            "Heavy Imports": runs[0][1],
+            "Passed": seconds <= budget and not runs[0][1],
+        }
+    if args.json:
+        print(json.dumps(results))
+    else:
+        for module, result in results.items():
+            print(
+                f"{module:<12} {result['Seconds']*1000:7.1f} ms"
+                f" / {result['Budget']*1000:5.0f} ms"
+                f"  {'ok' if result['Passed'] else 'FAILED'}"
+                f"  {' '.join(result['Heavy Imports'])}"
+            )
+    if not all(result["Passed"] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import cProfile
+import pstats
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from time import perf_counter
+
+
+@contextmanager
+def timed(phase_times: dict[str, float], phase: str) -> Iterator[None]:
+    # Adds the wall time of the block to the phase, in seconds
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        phase_times[phase] = (
+            phase_times.get(phase, 0.0) + perf_counter() - start
+        )
+
+
+class Instrumentation:
+    # Counters and wall times per phase of one simulation, with an optional
+    #   cProfile and tracemalloc capture of its run
+    def __init__(self,
+                 profile: bool = False,
+                 trace_memory: bool = False,
+                 top: int = 20) -> None:
+        self.counters: dict[str, int] = {}
+        self.phase_times: dict[str, float] = {}
+        self._profiler = cProfile.Profile() if profile else None
+        self._trace_memory = trace_memory
+        self._top = top
+        self._memory = None
+
+    def phase(self, phase: str) -> AbstractContextManager[None]:
+        return timed(self.phase_times, phase)
+
+    def update(self,
+               counters: dict[str, int],
+               phase_times: dict[str, float]) -> None:
+        self.counters |= counters
+        self.phase_times |= phase_times
+
+    @contextmanager
+    def capture(self) -> Iterator[None]:
+        # tracemalloc is left alone if something else is already tracing
+        trace_memory = self._trace_memory and not tracemalloc.is_tracing()
+        if trace_memory:
+            tracemalloc.start()
+        if self._profiler is not None:
+            self._profiler.enable()
+        try:
+            yield
+        finally:
+            if self._profiler is not None:
+                self._profiler.disable()
+            if trace_memory:
+                self._memory = (
+                    tracemalloc.get_traced_memory()[1],
+                    tracemalloc.take_snapshot().statistics("lineno"),
+                )
+                tracemalloc.stop()
+
+    def report(self) -> dict:
+        # Only built-in types, so the report can be dumped as JSON
+        report = {
+            "Counters": dict(self.counters),
+            "Phases": dict(self.phase_times),
+        }
+        if self._profiler is not None:
+            stats = pstats.Stats(self._profiler).stats
+            functions = sorted(
+                stats.items(), key=lambda item: item[1][3], reverse=True
+            )
+            report["Profile"] = [
+                {
+                    "Function": f"{file}:{line}({name})",
+                    "Calls": calls,
+                    "Total Time": total_time,
+                    "Cumulative Time": cumulative_time,
+                }
+                for (file, line, name), (_, calls, total_time,
+                                         cumulative_time, _)
+                in functions[:self._top]
+            ]
+        if self._memory is not None:
+            peak, statistics = self._memory
+            report["Memory"] = {
+                "Peak Bytes": peak,
+                "Top": [
+                    {
+                        "Location": str(stat.traceback),
+                        "Bytes": stat.size,
+                        "Count": stat.count,
+                    }
+                    for stat in statistics[:self._top]
+                ],
+            }
+        return report
@@ -0,0 +1,265 @@
+import json
+import sys
+from argparse import ArgumentParser
+from collections.abc import Iterator
+from dataclasses import asdict
+from itertools import islice
+from pathlib import Path
+from typing import Self
+
+import numpy as np
+
+from cache import CACHE_VERSION
+from cli import parse_values
+from sweep import iter_sweep
+from userinput import UserInput
+
+
+# Levels of each module in the app, in encoding order, least significant last
+LOOKUP_AXES = {
+    "drslv": range(7, 13),
+    "genlv": range(0, 16),
+    "enrlv": range(0, 16),
+    "ablv": range(1, 16),
+    "mboostlv": range(0, 16),
+    "remotelv": range(1, 16),
+    "minerlv": range(1, 8),
+    "minerqty": range(1, 5),
+    "boostqty": range(1, 26),
+    "_genrich_start_min": range(0, 10),
+}
+# The app's default advanced settings
+STANDARD_SETTINGS = {
+    "_genrich_lag": 10,
+    "tick_len": 10,
+    "_rmbug_lag": 10,
+    "exit_dur": 80,
+    "seed": 0,
+}
+LOOKUP_TABLE_PATH = Path("builds.lut")
+# Largest grid main builds without --all, 9 MB. The whole grid of
+#   LOOKUP_AXES is 38,707,200,000 builds and 348 GB.
+MAX_TABLE_BUILDS = 10**6
+
+MAGIC = b"DRSLUT1\n"
+MISSING, VALID, INVALID = 0, 1, 2
+ENTRY_DTYPE = np.dtype([
+    ("status", np.int8),
+    ("boosts", np.int16),
+    ("mining_delay", np.int16),
+    ("last_boost_time", np.int16),
+    ("exit_time", np.int16),
+])
+
+
+class LookupTable:
+    # Summaries of a grid of builds in a memory-mapped file. Entries are
+    #   indexed by the mixed-radix encoding of each build's position on
+    #   every axis; fields off the axes are fixed.
+    def __init__(self,
+                 axes: dict[str, list[int]],
+                 fixed: dict[str, int],
+                 entries: np.memmap) -> None:
+        self._axes = axes
+        self._fixed = fixed
+        self._positions = {
+            name: {value: pos for pos, value in enumerate(values)}
+            for name, values in axes.items()
+        }
+        self._shape = tuple(len(values) for values in axes.values())
+        self.entries = entries
+
+    @staticmethod
+    def _header(axes: dict[str, list[int]], fixed: dict[str, int]) -> bytes:
+        # Padded so that the entries start on a 64 byte boundary
+        header = json.dumps({
+            "version": CACHE_VERSION, "axes": axes, "fixed": fixed,
+        }).encode()
+        length = len(MAGIC) + 4 + len(header)
+        return (
+            MAGIC + length.to_bytes(4, "little") + header
+            + b" " * (-length % 64)
+        )
+
+    @classmethod
+    def create(cls,
+               path: str | Path,
+               axes: dict[str, list[int]],
+               fixed: dict[str, int]) -> Self:
+        axes = {name: list(values) for name, values in axes.items()}
+        header = cls._header(axes, fixed)
+        Path(path).write_bytes(header)
+        entries = np.memmap(
+            path, ENTRY_DTYPE, "r+", offset=len(header),
+            shape=(int(np.prod([len(values) for values in axes.values()])),),
+        )
+        return cls(axes, fixed, entries)
+
+    @classmethod
+    def open(cls, path: str | Path, mode: str = "r") -> Self | None:
+        # None if there is no table, or it was made by another engine version
+        path = Path(path)
+        if not path.exists():
+            return None
+        with path.open("rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            length = int.from_bytes(f.read(4), "little")
+            header = json.loads(f.read(length - len(MAGIC) - 4))
+        if header["version"] != CACHE_VERSION:
+            return None
+        offset = length + (-length % 64)
+        return cls(header["axes"], header["fixed"], np.memmap(
+            path, ENTRY_DTYPE, mode, offset=offset,
+        ))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def matches(self,
+                axes: dict[str, list[int]],
+                fixed: dict[str, int]) -> bool:
+        return self._fixed == fixed and self._axes == {
+            name: list(values) for name, values in axes.items()
+        }
+
+    def encode(self, inputs: UserInput) -> int | None:
+        # None for builds off the grid
+        fields = asdict(inputs)
+        if any(fields[name] != value for name, value in self._fixed.items()):
+            return None
+        try:
+            positions = [
+                self._positions[name][fields[name]] for name in self._axes
+            ]
+        except KeyError:
+            return None
+        return int(np.ravel_multi_index(positions, self._shape))
+
+    def decode(self, index: int) -> UserInput:
+        positions = np.unravel_index(index, self._shape)
+        return UserInput(**self._fixed, **{
+            name: values[pos]
+            for (name, values), pos in zip(self._axes.items(), positions)
+        })
+
+    def lookup(self, inputs: UserInput) -> dict[str, bool | int] | None:
+        # Summary like Simulation.summary, None if not in the table
+        index = self.encode(inputs)
+        if index is None or self.entries["status"][index] == MISSING:
+            return None
+        entry = self.entries[index]
+        return {
+            "Valid": bool(entry["status"] == VALID),
+            "Mining Delay": int(entry["mining_delay"]),
+            "Boosts": int(entry["boosts"]),
+            "Last Boost Time": int(entry["last_boost_time"]),
+            "Exit Time": int(entry["exit_time"]),
+        }
+
+    def store(self, inputs: UserInput, summary: dict[str, bool | int]) -> None:
+        self.entries[self.encode(inputs)] = (
+            VALID if summary["Valid"] else INVALID,
+            summary["Boosts"],
+            summary["Mining Delay"],
+            summary["Last Boost Time"],
+            summary["Exit Time"],
+        )
+
+    def missing(self, chunk_size: int = 2**20) -> Iterator[int]:
+        # Scanned a chunk at a time, so huge tables are never read at once
+        for start in range(0, len(self), chunk_size):
+            status = self.entries["status"][start:start+chunk_size]
+            yield from (start + np.flatnonzero(status == MISSING)).tolist()
+
+
+def build_table(path: str | Path,
+                axes: dict[str, list[int]] = LOOKUP_AXES,
+                fixed: dict[str, int] = STANDARD_SETTINGS,
+                max_workers: int | None = None,
+                chunk_size: int = 10000,
+                overwrite: bool = False) -> LookupTable:
+    # Simulates every build on the grid still missing from the table at the
+    #   path, so an interrupted build picks up where it stopped. Any other
+    #   file at the path, including a table of other builds or from another
+    #   engine version, is only replaced with overwrite.
+    table = LookupTable.open(path, "r+")
+    if table is None or not table.matches(axes, fixed):
+        if Path(path).exists() and not overwrite:
+            raise FileExistsError(
+                f"{path} is not a table of these builds for this version"
+            )
+        del table
+        table = LookupTable.create(path, axes, fixed)
+    missing = table.missing()
+    while chunk := list(islice(missing, chunk_size)):
+        configs = [table.decode(index) for index in chunk]
+        for inputs, summary in iter_sweep(configs, max_workers=max_workers):
+            table.store(inputs, summary)
+        table.entries.flush()
+    return table
+
+
+# Shared by every caller in the process, None until a table is built
+LOOKUP_TABLE = LookupTable.open(LOOKUP_TABLE_PATH)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = ArgumentParser(
+        prog="python -m lookup",
+        description=(
+            "Precompute the builds the app looks up instead of simulating. "
+            "Each axis defaults to every level offered by the app."
+        ),
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, default=LOOKUP_TABLE_PATH,
+        help=f"table file, resumed if present (default: {LOOKUP_TABLE_PATH})",
+    )
+    parser.add_argument(
+        "--axis", action="append", default=[], metavar="FIELD=VALUES",
+        help="levels of one field, e.g. genlv=10-15 or minerqty=1|4",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=0,
+        help="worker processes, 0 for one per CPU (default: 0)",
+    )
+    parser.add_argument(
+        "--all", action="store_true",
+        help=f"allow grids of more than {MAX_TABLE_BUILDS} builds",
+    )
+    parser.add_argument(
+        "--overwrite", action="store_true",
+        help="replace any other file or table at the output path",
+    )
+    args = parser.parse_args(argv)
+
+    axes = {name: list(values) for name, values in LOOKUP_AXES.items()}
+    for axis in args.axis:
+        name, _, cell = axis.partition("=")
+        if name not in axes:
+            parser.error(f"unknown axis {name}, expected one of {list(axes)}")
+        axes[name] = parse_values(cell)
+    size = int(np.prod([len(values) for values in axes.values()]))
+    print(
+        f"{size} builds, {size * ENTRY_DTYPE.itemsize} bytes", file=sys.stderr
+    )
+    if size > MAX_TABLE_BUILDS and not args.all:
+        parser.error(
+            f"{size} builds are too many to simulate, narrow the grid with "
+            "--axis or pass --all"
+        )
+    try:
+        table = build_table(
+            args.output, axes,
+            max_workers=args.jobs or None,
+            overwrite=args.overwrite,
+        )
+    except FileExistsError as e:
+        parser.error(f"{e}, pass --overwrite to replace it")
+    missing = sum(1 for _ in table.missing())
+    print(f"{len(table) - missing} builds done", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
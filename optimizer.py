@@ -0,0 +1,91 @@
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from batch import SUCCESS, BatchMining, FieldBatch
+from bounds import bounds, earliest_completions
+from constants import *
+from strategies import HydroField
+from userinput import UserInput
+
+
+# First genrich minutes offered by the app
+GENRICH_START_MINS = range(10)
+
+
+@dataclass(kw_only=True, frozen=True)
+class Plan:
+    genrich_start_min: int
+    # As reported by Simulation.get_mining_delay
+    mining_delay: int
+    last_boost_time: int
+    exit_time: int
+
+
+def optimize_plans(inputs: UserInput,
+                   start_mins: Iterable[int] = GENRICH_START_MINS
+                   ) -> list[Plan]:
+    # Plan with the earliest last boost, and so exit, for each first genrich
+    #   minute which can succeed. The field doesn't change before the first
+    #   genrich, so a later one replays the same attempts shifted by whole
+    #   minutes, only with less time left. When ticks divide a minute, one
+    #   batch of every delay for the earliest minute covers every minute.
+    start_mins = sorted(start_mins)
+    if not start_mins:
+        return []
+    hf = HydroField(
+        DRS_STARTING_HYDRO[inputs.drslv],
+        np.random.default_rng(inputs.seed),
+    )
+    delays = np.arange(0, 2 * inputs.genrich_cd, inputs.tick_len)
+    exit_ticks = -(-inputs.exit_dur // inputs.tick_len)
+    references = (
+        start_mins[:1] if MINUTE % inputs.tick_len == 0 else start_mins
+    )
+    plans = []
+    for reference in references:
+        reference_inputs = replace(inputs, _genrich_start_min=reference)
+        if not bounds(reference_inputs).feasible:
+            # Later minutes only leave less time
+            break
+        engine = BatchMining(
+            reference_inputs, FieldBatch.from_fields([hf] * len(delays))
+        )
+        outcomes, completed = engine.attempt(
+            np.arange(len(delays)),
+            delays,
+            bounds=earliest_completions(reference_inputs, delays),
+        )
+        if not (outcomes == SUCCESS).any():
+            continue
+        # The earliest success stays the earliest at every shift
+        best = np.flatnonzero(outcomes == SUCCESS)[
+            np.argmin(completed[outcomes == SUCCESS])
+        ]
+        shifted = [reference] if len(references) > 1 else start_mins
+        for start_min in shifted:
+            last_boost_time = (
+                int(completed[best]) + (start_min - reference) * MINUTE
+            )
+            if last_boost_time > MAX_TIME:
+                break
+            plans.append(Plan(
+                genrich_start_min=start_min,
+                mining_delay=int(delays[best]) + inputs.tick_len,
+                last_boost_time=last_boost_time,
+                exit_time=last_boost_time + exit_ticks * inputs.tick_len,
+            ))
+    return plans
+
+
+def pareto_frontier(plans: Iterable[Plan]) -> list[Plan]:
+    # Plans which no plan with a later first genrich, which is easier to
+    #   make, beats on exit time
+    frontier = []
+    for plan in sorted(
+        plans, key=lambda plan: (-plan.genrich_start_min, plan.exit_time)
+    ):
+        if not frontier or plan.exit_time < frontier[-1].exit_time:
+            frontier.append(plan)
+    return frontier[::-1]
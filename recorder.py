@@ -0,0 +1,75 @@
+from typing import Self
+
+import numpy as np
+
+
+class TraceRecorder:
+    # Typed columns in preallocated arrays which double in size when full
+    def __init__(self,
+                 dtypes: dict[str, type],
+                 capacity: int = 256) -> None:
+        self._columns = {
+            name: np.empty(capacity, dtype=dtype)
+            for name, dtype in dtypes.items()
+        }
+        self._capacity = capacity
+        self._len = 0
+        # Rows appended over the recorder's life, which truncating leaves
+        self.rows_written = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        # A view of the recorded rows, not a copy
+        return self._columns[name][:self._len]
+
+    @classmethod
+    def from_columns(cls, columns: dict[str, np.ndarray]) -> Self:
+        new_tr = TraceRecorder.__new__(TraceRecorder)
+        new_tr._columns = dict(columns)
+        new_tr._len = len(next(iter(columns.values()), ()))
+        new_tr._capacity = new_tr._len
+        new_tr.rows_written = new_tr._len
+        return new_tr
+
+    def columns(self) -> dict[str, np.ndarray]:
+        return {name: self[name] for name in self._columns}
+
+    def copy(self) -> Self:
+        new_tr = TraceRecorder.__new__(TraceRecorder)
+        new_tr._columns = {
+            name: column[:self._len].copy()
+            for name, column in self._columns.items()
+        }
+        new_tr._capacity = self._len
+        new_tr._len = self._len
+        new_tr.rows_written = self._len
+        return new_tr
+
+    def _reserve(self, count: int) -> None:
+        if self._len + count <= self._capacity:
+            return
+        self._capacity = max(2 * self._capacity, self._len + count)
+        for name, column in self._columns.items():
+            grown = np.empty(self._capacity, dtype=column.dtype)
+            grown[:self._len] = column[:self._len]
+            self._columns[name] = grown
+
+    def append(self, **values) -> None:
+        self._reserve(1)
+        for name, value in values.items():
+            self._columns[name][self._len] = value
+        self._len += 1
+        self.rows_written += 1
+
+    def extend(self, count: int, **values) -> None:
+        # Values are arrays of length count, or scalars repeated count times
+        self._reserve(count)
+        for name, value in values.items():
+            self._columns[name][self._len:self._len+count] = value
+        self._len += count
+        self.rows_written += count
+
+    def truncate(self, length: int) -> None:
+        self._len = min(self._len, length)
@@ -0,0 +1,73 @@
+import numpy as np
+from pandas import DataFrame as df
+
+from formatters import format_duration, format_durations
+from strategies import FIELD_STATUSES, MINING_STATUSES, ROID_NAMES
+from strategies import STATUS_TIME_NAMES
+
+
+class SimulationResults:
+    # Traces of a finished simulation, looked up by DRS time in seconds.
+    #   A time between ticks reads the last tick at or before it.
+    def __init__(self,
+                 progress: dict[str, np.ndarray],
+                 field: dict[str, np.ndarray],
+                 status_time: dict[str, np.ndarray]) -> None:
+        self._progress = progress
+        self._field = field
+        self._status_time = status_time
+        self.times = np.unique(progress["time"])
+        # Prefix sums per status, after a row for before the first tick
+        self._elapsed = np.vstack([
+            np.zeros(len(STATUS_TIME_NAMES), dtype=int),
+            np.column_stack([
+                status_time[name] for name in STATUS_TIME_NAMES
+            ]),
+        ])
+
+    @property
+    def time_max(self) -> int:
+        return int(self.times[-1])
+
+    def _tick_index(self, time: int) -> int:
+        return int(np.searchsorted(self.times, time, "right")) - 1
+
+    def progress_until(self, time: int | None = None) -> df:
+        # Every progress record up to and including the given time
+        end = len(self._progress["time"]) if time is None else int(
+            np.searchsorted(self._progress["time"], time, "right")
+        )
+        data = {name: column[:end] for name, column in self._progress.items()}
+        return df({
+            "Time": data["time"],
+            "Duration": format_durations(data["time"]),
+            "Boosts": data["boosts"],
+            "Tank": data["tank"],
+            "Total Hydro": data["total_hydro"],
+            "Mining Status": MINING_STATUSES[data["status"]],
+        }, copy=False)
+
+    def field_at(self, time: int) -> df:
+        # Every Remaining row of the tick followed by every Collected row
+        tick = int(self.times[self._tick_index(time)])
+        start, end = np.searchsorted(self._field["time"], [tick, tick + 1])
+        data = {
+            name: column[start:end] for name, column in self._field.items()
+        }
+        return df({
+            "Time": np.tile(data["time"], 2),
+            "Duration": format_duration(tick),
+            "Active": np.tile(data["active"], 2),
+            "Roid": ROID_NAMES[np.tile(data["roid"], 2)],
+            "Status": np.repeat(FIELD_STATUSES, len(data["time"])),
+            "Hydro": np.concatenate([data["remaining"], data["collected"]]),
+        })
+
+    def status_breakdown(self, time: int) -> df:
+        # Seconds spent in each status, in total and up to the given time
+        row = np.searchsorted(self._status_time["time"], time, "right")
+        return df({
+            "Status": MINING_STATUSES,
+            "Total Duration (seconds)": self._elapsed[-1],
+            "Elapsed Duration (seconds)": self._elapsed[row],
+        })
@@ -0,0 +1,10 @@
+import numpy as np
+
+
+def spawn_seeds(seed: int | None, count: int) -> list[int]:
+    # Seeds for independent streams, e.g. one per parallel task. They are
+    #   kept to 63 bits so they fit in int64 columns and arrays.
+    return [
+        int(child.generate_state(1, np.uint64)[0]) >> 1
+        for child in np.random.SeedSequence(seed).spawn(count)
+    ]
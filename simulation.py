@@ -1,37 +1,141 @@
-from typing import Self
+from collections.abc import Callable, Generator, Iterable
+from threading import Event
+from typing import TYPE_CHECKING, Self
 
-from pandas import DataFrame as df
+import numpy as np
 
-from strategies import MiningStrategy
+from enums import MiningStatus as MS
+from instrumentation import Instrumentation
+from optimizer import GENRICH_START_MINS, Plan
+from optimizer import optimize_plans, pareto_frontier
+from strategies import MiningStrategy, SearchProgress, TickRecord
 from userinput import UserInput
 
+if TYPE_CHECKING:
+    from pandas import DataFrame as df
+
+    from results import SimulationResults
+
 
 class Simulation:
     def __init__(self, inputs: UserInput) -> None:
         self._valid = False
         self._strategy = None
         self._inputs = inputs
+        self._instrumentation = Instrumentation()
+        self._plans: list[Plan] = []
 
     @property
     def valid(self) -> None:
         return self._valid
     
-    def set_strategy(self, mining_strategy: type[MiningStrategy]) -> Self:
-        self._strategy = mining_strategy(self._inputs)
+    @property
+    def instrumentation(self) -> Instrumentation:
+        return self._instrumentation
+
+    def instrument(self,
+                   profile: bool = False,
+                   trace_memory: bool = False) -> Self:
+        # Also capture a cProfile and tracemalloc report of the run
+        self._instrumentation = Instrumentation(profile, trace_memory)
+        return self
+    
+    def set_strategy(self,
+                     mining_strategy: type[MiningStrategy],
+                     **options) -> Self:
+        self._strategy = mining_strategy(self._inputs, **options)
         return self
     
-    def read_mining_progress_data(self) -> df:
-        return self._strategy.read_mining_progress_data()
+    def read_mining_progress_data(self) -> "df":
+        with self._instrumentation.phase("Export"):
+            return self._strategy.read_mining_progress_data()
     
-    def read_hydro_field_data(self) -> df:
-        return self._strategy.read_hydro_field_data()
+    def read_hydro_field_data(self) -> "df":
+        with self._instrumentation.phase("Export"):
+            return self._strategy.read_hydro_field_data()
+    
+    def read_results(self) -> "SimulationResults":
+        # pandas is only imported by the first caller that needs DataFrames
+        with self._instrumentation.phase("Export"):
+            from results import SimulationResults
+            return SimulationResults(*self._strategy.get_traces())
     
     def get_mining_delay(self) -> int:
         return self._strategy.get_mining_delay()
+
+    def get_status_time(self, time: int | None = None) -> dict[MS, int]:
+        return self._strategy.get_status_time(time)
+
+    def get_search_simulations(self) -> int:
+        return self._strategy.get_search_simulations()
+
+    def summary(self) -> dict[str, bool | int]:
+        return {
+            "Valid": self._valid,
+            "Mining Delay": self.get_mining_delay(),
+            "Boosts": self._strategy.get_boosts(),
+            "Last Boost Time": self._strategy.get_last_boost_time(),
+            "Exit Time": self._strategy.get_exit_time(),
+            "Simulations": self.get_search_simulations(),
+        }
+
+    def optimize_genrich(
+        self, start_mins: Iterable[int] = GENRICH_START_MINS
+    ) -> Self:
+        # Plans the first genrich minute and mining delay together, in place
+        #   of the inputs' own first genrich minute
+        with self._instrumentation.phase("Optimize"):
+            self._plans = optimize_plans(self._inputs, start_mins)
+        return self
+
+    def get_plans(self) -> list[Plan]:
+        return self._plans
+
+    def get_best_plan(self) -> Plan | None:
+        # Earliest exit, then earliest first genrich
+        return min(
+            self._plans,
+            key=lambda plan: (plan.exit_time, plan.genrich_start_min),
+            default=None,
+        )
+
+    def get_pareto_frontier(self) -> list[Plan]:
+        return pareto_frontier(self._plans)
+
+    def get_stats(self) -> dict:
+        return self._instrumentation.report()
     
-    def run(self) -> Self:
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        return {"valid": np.array(self._valid)} | self._strategy.save_result()
+
+    def load_arrays(self, arrays: dict[str, np.ndarray]) -> Self:
+        # Restores a finished simulation instead of running it
+        self._valid = bool(arrays["valid"])
+        self._strategy.load_result(arrays)
+        return self
+    
+    def run(self,
+            progress: Callable[[SearchProgress], None] | None = None,
+            cancel: Event | None = None) -> Self:
+        # See MiningStrategy.watch
+        self._strategy.watch(progress, cancel)
+        with self._instrumentation.capture():
+            try:
+                self._valid = self._strategy.run()
+            except AttributeError:
+                self._valid = False
+        self._instrumentation.update(*self._strategy.get_stats())
+        return self
+
+    def iter_ticks(
+        self, stop: Callable[[TickRecord], bool] | None = None
+    ) -> Generator[TickRecord, None, None]:
+        # Runs while streaming progress records instead of keeping traces,
+        #   see MiningStrategy.iter_ticks. Valid once the stream is exhausted.
+        self._valid = False
         try:
-            self._valid = self._strategy.run()
+            self._valid = yield from self._strategy.iter_ticks(stop)
         except AttributeError:
             self._valid = False
-        return self
+        finally:
+            self._instrumentation.update(*self._strategy.get_stats())
@@ -1,32 +1,74 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from math import floor
-from random import uniform
-from typing import Self
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Sequence
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import TYPE_CHECKING, NamedTuple, Self
 
-from pandas import DataFrame as df
+import numpy as np
 
+from bounds import bounds
 from constants import *
+from delaysearch import DelaySearch
+from enums import AttemptOutcome as AO
 from enums import MiningStatus as MS
-from formatters import format_duration
+from enums import Recording
+from enums import SearchMethod as SM
+from formatters import format_durations
+from instrumentation import timed
+from recorder import TraceRecorder
 from userinput import UserInput
 
+if TYPE_CHECKING:
+    from pandas import DataFrame as df
+
+
+MINING_STATUSES = np.array(list(MS), dtype=object)
+STATUS_CODES = {ms: code for code, ms in enumerate(MS)}
+ROID_INDICES = np.arange(MAX_ROIDS, dtype=np.int8)
+ROID_NAMES = np.array([f"r{i:02}" for i in range(MAX_ROIDS)], dtype=object)
+FIELD_STATUSES = np.array(["Remaining", "Collected"], dtype=object)
+
+PROGRESS_COLUMNS = {
+    "time": np.int32,
+    "boosts": np.int16,
+    "tank": np.float64,
+    "total_hydro": np.float64,
+    "status": np.int8,
+}
+# Seconds spent in each status up to each tick
+STATUS_TIME_NAMES = [ms.name.lower() for ms in MS]
+STATUS_TIME_COLUMNS = {"time": np.int32} | {
+    name: np.int32 for name in STATUS_TIME_NAMES
+}
+FIELD_COLUMNS = {
+    "time": np.int32,
+    "roid": np.int8,
+    "active": np.bool_,
+    "remaining": np.float64,
+    "collected": np.float64,
+}
+
 
 class HydroField:
-    def __init__(self, total_hydro: int) -> None:
-        self._roids = [0 for _ in range(MAX_ROIDS)]
-        self._collected = [0 for _ in range(MAX_ROIDS)]
-        self._roids[0:START_ROIDS-1] = [
-            round(uniform(total_hydro / 8 * 0.9, total_hydro / 8 * 1.1))
-            for _ in range(START_ROIDS-1)
-        ]
-        self._roids[START_ROIDS-1] = total_hydro - sum(self._roids)
+    def __init__(self,
+                 total_hydro: int,
+                 rng: np.random.Generator | None = None) -> None:
+        if rng is None:
+            rng = np.random.default_rng()
+        # Remaining and collected hydro share one buffer
+        self._buffer = np.zeros((2, MAX_ROIDS))
+        self._roids, self._collected = self._buffer
+        self._roids[0:START_ROIDS-1] = np.round(rng.uniform(
+            total_hydro / 8 * 0.9, total_hydro / 8 * 1.1, START_ROIDS-1
+        ))
+        self._roids[START_ROIDS-1] = total_hydro - self._roids.sum()
         self._gen_counter = 0
     
     def copy(self) -> Self:
-        new_hf = HydroField(0)
-        new_hf._roids = self._roids[:]
-        new_hf._collected = self._collected[:]
+        new_hf = HydroField.__new__(HydroField)
+        new_hf._buffer = self._buffer.copy()
+        new_hf._roids, new_hf._collected = new_hf._buffer
         new_hf._gen_counter = self._gen_counter
         return new_hf
     
@@ -36,57 +78,181 @@ class HydroField:
         cur_roids = START_ROIDS + self._gen_counter
         if cur_roids < MAX_ROIDS:
             new_roids = min(GENESIS_ROIDS, MAX_ROIDS - cur_roids)
-            self._roids[cur_roids:cur_roids+new_roids] = (
-                [new_roid_amt for _ in range(new_roids)]
-            )
+            self._roids[cur_roids:cur_roids+new_roids] = new_roid_amt
             self._gen_counter += new_roids
         # Enrich
-        self._roids = [min(floor(r * enr_mult), H_MAX) for r in self._roids]
-        self._collected = [0 for _ in range(MAX_ROIDS)]
+        np.multiply(self._roids, enr_mult, out=self._roids)
+        np.floor(self._roids, out=self._roids)
+        np.minimum(self._roids, H_MAX, out=self._roids)
+        self._collected[:] = 0
 
-    def sort_rm_targets(self) -> list[int]:
-        return [
-            idx for idx, value in sorted(
-                enumerate(self._roids), key=lambda x: x[1], reverse=True
-            )
-        ]
+    def sort_rm_targets(self, count: int = MAX_ROIDS) -> np.ndarray:
+        # Largest asteroids first, ties broken by position like sorted()
+        keys = -self._roids
+        if count < MAX_ROIDS:
+            cutoff = keys[np.argpartition(keys, count - 1)[count - 1]]
+            candidates = np.flatnonzero(keys <= cutoff)
+        else:
+            candidates = np.arange(MAX_ROIDS)
+        order = np.argsort(keys[candidates], kind="stable")
+        return candidates[order[:count]]
 
-    def collect(self, total_amt: float, rm_targets: Iterable[int]) -> None:
+    def collect(self, total_amt: float, rm_targets: np.ndarray) -> None:
         amt_per_roid = total_amt / len(rm_targets)
-        for idx in rm_targets:
-            self._collected[idx] += min(self._roids[idx], amt_per_roid)
-            self._roids[idx] -= min(self._roids[idx], amt_per_roid)
+        mined = np.minimum(self._roids[rm_targets], amt_per_roid)
+        self._collected[rm_targets] += mined
+        self._roids[rm_targets] -= mined
 
     @property
-    def total_hydro(self) -> float:
-        return sum(self._roids)
-    
+    def roids(self) -> np.ndarray:
+        return self._roids
+
     @property
-    def field_state(self) -> list[list[str | float]]:
-        return [
-            [f"r{i:02}", self._roids[i], self._collected[i]]
-            for i in range(MAX_ROIDS)
-        ]
+    def collected(self) -> np.ndarray:
+        return self._collected
+
+    @property
+    def gen_counter(self) -> int:
+        return self._gen_counter
+
+    @property
+    def total_hydro(self) -> float:
+        # cumsum adds in order, unlike the pairwise summation of sum()
+        return self._roids.cumsum()[-1]
     
     def drained_roid(self) -> bool:
         return all([
             self._gen_counter == MAX_ROIDS - START_ROIDS,
-            min(self._roids) == 0
+            self._roids.min() == 0
         ])
 
 
+class SimulationCancelled(Exception):
+    pass
+
+
+class SearchProgress(NamedTuple):
+    # Attempts so far, and the mining delay and time of the current one
+    attempts: int
+    mining_delay: int
+    time: int
+
+
+class TickRecord(NamedTuple):
+    # One row of the mining progress trace
+    time: int
+    boosts: int
+    tank: float
+    total_hydro: float
+    status: MS
+
+
+@dataclass(kw_only=True, frozen=True)
+class StrategyState:
+    hf: HydroField
+    time: int
+    last_genrich: int
+    last_artboost: int
+    tank: float
+    boosts: int
+    status: MS
+    rm_targets: np.ndarray | None
+    recording: Recording
+    status_time: tuple[int, ...]
+    counted_time: int
+    trace_lengths: tuple[int, int, int]
+
+
+class BaseStateCache:
+    # Untraced base field setups keyed on UserInput.base_field_key, so builds
+    #   which only differ in miner stats share them. The least recently used
+    #   ones are evicted past max_entries. Safe to share between threads.
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._entries: OrderedDict[tuple, StrategyState] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "Hits": self.hits,
+            "Misses": self.misses,
+            "Entries": len(self._entries),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, inputs: UserInput) -> StrategyState | None:
+        # Unseeded fields are random, so their setup can't be shared
+        key = inputs.base_field_key
+        with self._lock:
+            if inputs.seed is None or key not in self._entries:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, inputs: UserInput, state: StrategyState) -> None:
+        # The first setup put for a key is kept
+        if inputs.seed is None:
+            return
+        with self._lock:
+            if inputs.base_field_key in self._entries:
+                return
+            self._entries[inputs.base_field_key] = state
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+# Shared by every strategy in the process
+BASE_STATE_CACHE = BaseStateCache()
+
+
 class MiningStrategy(ABC):
-    def __init__(self, inputs: UserInput) -> None:
+    def __init__(self,
+                 inputs: UserInput,
+                 search_method: SM = SM.LINEAR,
+                 recording: Recording = Recording.FULL,
+                 base: StrategyState | None = None,
+                 mining_delay: int | None = None) -> None:
         self._inputs = inputs
-        self._base_hf = HydroField(DRS_STARTING_HYDRO[self._inputs.drslv])
+        self._search_method = search_method
+        # Requested level for the result, and the level currently in use
+        self._trace_level = recording
+        self._recording = recording
+        self._search = None
+        self._simulations = 0
+        self._base_hf = HydroField(
+            DRS_STARTING_HYDRO[self._inputs.drslv],
+            np.random.default_rng(self._inputs.seed),
+        )
         self._base_time = 0
-        self._base_mining_progress_data = []
-        self._base_hydro_field_data = []
+        # Base field setup shared by another strategy, see base_state
+        self._shared_base = base
+        # Known mining delay as reported by get_mining_delay, e.g. from a
+        #   lookup table, which is tried alone instead of searched for
+        self._known_delay = mining_delay
+        self._mining_progress_data = TraceRecorder(PROGRESS_COLUMNS)
+        self._hydro_field_data = TraceRecorder(FIELD_COLUMNS)
+        self._status_time_data = TraceRecorder(STATUS_TIME_COLUMNS)
+        self._base_trace_lengths = (0, 0, 0)
+        self._base_status_time = (0,) * len(MS)
         self._rm_targets = None
         self._mining_delay = 0
         self._max_mining_delay = 2 * self._inputs.genrich_cd
-        self._max_time = 40 * MINUTE
+        self._max_time = MAX_TIME
         self._status = MS.CLEARING
+        self._snapshots: dict[int, StrategyState] = {}
+        # Work done, which snapshots and resets leave alone
+        self._ticks_stepped = 0
+        self._ticks_skipped = 0
+        self._phase_times: dict[str, float] = {}
+        self._progress = None
+        self._cancel = None
         self._reset()
     
     def _reset(self) -> None:
@@ -94,8 +260,12 @@ class MiningStrategy(ABC):
         self._time = self._base_time
         self._last_genrich = self._base_time
         self._last_artboost = 0
-        self._mining_progress_data = self._base_mining_progress_data[:]
-        self._hydro_field_data = self._base_hydro_field_data[:]
+        # The base rows are shared by every attempt
+        self._mining_progress_data.truncate(self._base_trace_lengths[0])
+        self._hydro_field_data.truncate(self._base_trace_lengths[1])
+        self._status_time_data.truncate(self._base_trace_lengths[2])
+        self._status_time = list(self._base_status_time)
+        self._counted_time = self._base_time
         # All miners combined
         self._tank = 0
         self._tank_max = self._inputs.tanksize * self._inputs.minerqty
@@ -105,8 +275,90 @@ class MiningStrategy(ABC):
     def run(self) -> bool:
         pass
 
+    @abstractmethod
+    def iter_ticks(
+        self, stop: Callable[[TickRecord], bool] | None = None
+    ) -> Generator[TickRecord, None, bool]:
+        pass
+
+    def watch(self,
+              progress: Callable[[SearchProgress], None] | None = None,
+              cancel: Event | None = None) -> None:
+        # progress is called on every event tick of every attempt, and cancel
+        #   is checked as often. Once it is set, the run raises
+        #   SimulationCancelled.
+        self._progress = progress
+        self._cancel = cancel
+
+    def check_in(self) -> None:
+        if self._progress is not None:
+            self._progress(SearchProgress(
+                self.get_search_simulations(),
+                self.get_mining_delay(),
+                self._time,
+            ))
+        if self._cancel is not None and self._cancel.is_set():
+            raise SimulationCancelled
+
+    def snapshot(self) -> StrategyState:
+        return StrategyState(
+            hf=self._hf.copy(),
+            time=self._time,
+            last_genrich=self._last_genrich,
+            last_artboost=self._last_artboost,
+            tank=self._tank,
+            boosts=self._boosts,
+            status=self._status,
+            rm_targets=(
+                None if self._rm_targets is None else self._rm_targets.copy()
+            ),
+            recording=self._recording,
+            status_time=tuple(self._status_time),
+            counted_time=self._counted_time,
+            trace_lengths=self.trace_lengths(),
+        )
+
+    def restore(self, state: StrategyState) -> None:
+        # Traces are truncated back, so the rows written before the snapshot
+        #   must not have been replaced since it was taken
+        self._hf = state.hf.copy()
+        self._time = state.time
+        self._last_genrich = state.last_genrich
+        self._last_artboost = state.last_artboost
+        self._tank = state.tank
+        self._boosts = state.boosts
+        self._status = state.status
+        self._rm_targets = (
+            None if state.rm_targets is None else state.rm_targets.copy()
+        )
+        self._mining_progress_data.truncate(state.trace_lengths[0])
+        self._hydro_field_data.truncate(state.trace_lengths[1])
+        self._status_time_data.truncate(state.trace_lengths[2])
+        self._status_time = list(state.status_time)
+        self._counted_time = state.counted_time
+
+    def trace_lengths(self) -> tuple[int, int, int]:
+        return (
+            len(self._mining_progress_data),
+            len(self._hydro_field_data),
+            len(self._status_time_data),
+        )
+
     def tick(self) -> None:
         self._time += self._inputs.tick_len
+        self._ticks_stepped += 1
+
+    def ticks_until(self, time: int) -> int:
+        # Ticks needed to reach the first tick at or after the given time
+        return max(0, -((self._time - time) // self._inputs.tick_len))
+
+    def idle(self, ticks: int) -> None:
+        # Jump over ticks in which nothing changes but the time
+        if ticks <= 0:
+            return
+        self._time += ticks * self._inputs.tick_len
+        self._ticks_skipped += ticks
+        self.write_idle_data(ticks)
 
     def genrich_and_write_data(self) -> None:
         self._hf.genrich(self._inputs.gen, self._inputs.enr)
@@ -116,138 +368,468 @@ class MiningStrategy(ABC):
         self.write_mining_progress_data()
         self.write_hydro_field_data()
     
+    def count_status_time(self, ticks: int = 1) -> None:
+        # Each of the last ticks counts towards the status of its first
+        #   record, except for the record at time 0
+        if self._time <= self._counted_time:
+            return
+        tick_len = self._inputs.tick_len
+        code = STATUS_CODES[self._status]
+        elapsed = self._status_time[code]
+        self._status_time[code] += ticks * tick_len
+        self._counted_time = self._time
+        if self._recording == Recording.NONE:
+            return
+        status_time = dict(zip(STATUS_TIME_NAMES, self._status_time))
+        status_time[STATUS_TIME_NAMES[code]] = (
+            elapsed + tick_len * np.arange(1, ticks + 1)
+        )
+        self._status_time_data.extend(
+            ticks,
+            time=np.arange(
+                self._time - (ticks - 1) * tick_len, self._time + 1, tick_len
+            ),
+            **status_time,
+        )
+
+    def write_idle_data(self, ticks: int) -> None:
+        # Same rows as calling write_all_data after each of the last ticks
+        self.count_status_time(ticks)
+        if self._recording == Recording.NONE:
+            return
+        tick_len = self._inputs.tick_len
+        times = np.arange(
+            self._time - (ticks - 1) * tick_len, self._time + 1, tick_len
+        )
+        self._mining_progress_data.extend(
+            ticks,
+            time=times,
+            boosts=self._boosts,
+            tank=self._tank,
+            total_hydro=self._hf.total_hydro,
+            status=STATUS_CODES[self._status],
+        )
+        if self._recording != Recording.FULL:
+            return
+        self._hydro_field_data.extend(
+            ticks * MAX_ROIDS,
+            time=np.repeat(times, MAX_ROIDS),
+            roid=np.tile(ROID_INDICES, ticks),
+            active=np.tile(self.active_roids(), ticks),
+            remaining=np.tile(self._hf.roids, ticks),
+            collected=np.tile(self._hf.collected, ticks),
+        )
+
     def write_mining_progress_data(self) -> None:
-        self._mining_progress_data.append([
-            self._time,
-            format_duration(self._time),
-            self._boosts,
-            self._tank,
-            self._hf.total_hydro,
-            self._status,
-        ])
+        self.count_status_time()
+        if self._recording == Recording.NONE:
+            return
+        self._mining_progress_data.append(
+            time=self._time,
+            boosts=self._boosts,
+            tank=self._tank,
+            total_hydro=self._hf.total_hydro,
+            status=STATUS_CODES[self._status],
+        )
     
     def write_hydro_field_data(self) -> None:
-        self._hydro_field_data.extend([
-            [
-                self._time, format_duration(self._time),
-                self.is_roid_active(record[0]), *record,
-            ]
-            for record in self._hf.field_state
-        ])
-
-    def read_mining_progress_data(self) -> df:
-        return df.from_records(
-            self._mining_progress_data,
-            columns=[
-                "Time", "Duration", "Boosts", "Tank", "Total Hydro",
-                "Mining Status",
-            ]
+        if self._recording != Recording.FULL:
+            return
+        self._hydro_field_data.extend(
+            MAX_ROIDS,
+            time=self._time,
+            roid=ROID_INDICES,
+            active=self.active_roids(),
+            remaining=self._hf.roids,
+            collected=self._hf.collected,
         )
+
+    def read_mining_progress_data(self) -> "df":
+        # Columns are views of the trace, durations are only formatted here
+        from pandas import DataFrame as df
+        data = self._mining_progress_data
+        return df({
+            "Time": data["time"],
+            "Duration": format_durations(data["time"]),
+            "Boosts": data["boosts"],
+            "Tank": data["tank"],
+            "Total Hydro": data["total_hydro"],
+            "Mining Status": MINING_STATUSES[data["status"]],
+        }, copy=False)
     
-    def read_hydro_field_data(self) -> df:
-        return df.from_records(
-            self._hydro_field_data,
-            columns=[
-                "Time", "Duration", "Active", "Roid", "Remaining", "Collected"
-            ]
-        ).melt(
-            ["Time", "Duration", "Active", "Roid"],
-            var_name="Status",
-            value_name="Hydro"
-        )
+    def read_hydro_field_data(self) -> "df":
+        # Long format with every Remaining row followed by every Collected row
+        from pandas import DataFrame as df
+        data = self._hydro_field_data
+        time = np.tile(data["time"], 2)
+        return df({
+            "Time": time,
+            "Duration": format_durations(time),
+            "Active": np.tile(data["active"], 2),
+            "Roid": ROID_NAMES[np.tile(data["roid"], 2)],
+            "Status": np.repeat(FIELD_STATUSES, len(data)),
+            "Hydro": np.concatenate([data["remaining"], data["collected"]]),
+        }, copy=False)
     
-    def is_roid_active(self, roid: str) -> bool:
-        rnum = int(roid[1:])
-        return self._status == MS.MINING and rnum in self._rm_targets
+    def active_roids(self) -> np.ndarray:
+        active = np.zeros(MAX_ROIDS, dtype=bool)
+        if self._status == MS.MINING:
+            active[self._rm_targets] = True
+        return active
 
     def get_mining_delay(self) -> int:
         return self._mining_delay + self._inputs.tick_len
+
+    def get_boosts(self) -> int:
+        return self._boosts
+
+    def get_last_boost_time(self) -> int:
+        return self._last_artboost
+
+    def get_exit_time(self) -> int:
+        return self._time
+
+    def get_traces(self) -> tuple[dict[str, np.ndarray], ...]:
+        return (
+            self._mining_progress_data.columns(),
+            self._hydro_field_data.columns(),
+            self._status_time_data.columns(),
+        )
+
+    def get_status_time(self, time: int | None = None) -> dict[MS, int]:
+        # Seconds spent in each status, in total or up to the given time
+        if time is None:
+            return dict(zip(MS, self._status_time))
+        data = self._status_time_data
+        row = int(np.searchsorted(data["time"], time, "right")) - 1
+        if row < 0:
+            return dict.fromkeys(MS, 0)
+        return {
+            ms: int(data[name][row]) for ms, name in zip(MS, STATUS_TIME_NAMES)
+        }
+
+    def get_search_simulations(self) -> int:
+        if self._search is None:
+            return self._simulations
+        return self._search.simulations
+
+    def get_stats(self) -> tuple[dict[str, int], dict[str, float]]:
+        # Counters and wall times per phase of the last run
+        counters = {
+            "Attempts": self.get_search_simulations(),
+            "Snapshots": len(self._snapshots),
+            "Ticks Stepped": self._ticks_stepped,
+            "Ticks Skipped": self._ticks_skipped,
+        }
+        for name, trace in [
+            ("Progress", self._mining_progress_data),
+            ("Field", self._hydro_field_data),
+            ("Status Time", self._status_time_data),
+        ]:
+            counters[f"{name} Rows Written"] = trace.rows_written
+            counters[f"{name} Rows Kept"] = len(trace)
+        return counters, dict(self._phase_times)
+
+    def save_result(self) -> dict[str, np.ndarray]:
+        # Everything the read and get methods need, as named arrays
+        arrays = {
+            "mining_delay": np.array(self._mining_delay),
+            "boosts": np.array(self._boosts),
+            "last_artboost": np.array(self._last_artboost),
+            "time": np.array(self._time),
+            "simulations": np.array(self.get_search_simulations()),
+            "status_time": np.array(self._status_time),
+        }
+        for name, column in self._mining_progress_data.columns().items():
+            arrays[f"progress_{name}"] = column
+        for name, column in self._hydro_field_data.columns().items():
+            arrays[f"field_{name}"] = column
+        for name, column in self._status_time_data.columns().items():
+            arrays[f"status_time_{name}"] = column
+        return arrays
+
+    def load_result(self, arrays: dict[str, np.ndarray]) -> None:
+        self._mining_delay = int(arrays["mining_delay"])
+        self._boosts = int(arrays["boosts"])
+        self._last_artboost = int(arrays["last_artboost"])
+        self._time = int(arrays["time"])
+        self._search = None
+        self._simulations = int(arrays["simulations"])
+        self._status_time = arrays["status_time"].tolist()
+        self._mining_progress_data = TraceRecorder.from_columns({
+            name: arrays[f"progress_{name}"] for name in PROGRESS_COLUMNS
+        })
+        self._hydro_field_data = TraceRecorder.from_columns({
+            name: arrays[f"field_{name}"] for name in FIELD_COLUMNS
+        })
+        self._status_time_data = TraceRecorder.from_columns({
+            name: arrays[f"status_time_{name}"]
+            for name in STATUS_TIME_COLUMNS
+        })
     
     def get_new_rm_targets(self) -> None:
         self._rm_targets = (
-            self._hf.sort_rm_targets()[:self._inputs.remote_max_targets]
+            self._hf.sort_rm_targets(self._inputs.remote_max_targets)
         )
     
     ### Mining components
     def exit_miners(self) -> None:
         completed_mining = self._time
         self._status = MS.EXITING
-        while self._time < completed_mining + self._inputs.exit_dur:
-            self.tick()
-            self.write_all_data()
+        self.idle(self.ticks_until(completed_mining + self._inputs.exit_dur))
+
+    def wait_until(self, ticks: int, mining_start: int) -> None:
+        # Miners that could mine but are not allowed to are waiting
+        before_start = min(ticks, max(0, self.ticks_until(mining_start) - 1))
+        self.idle(before_start)
+        if ticks > before_start:
+            self._status = MS.WAITING
+            self.idle(ticks - before_start)
+
+    def next_event(self, mining_start: int) -> int:
+        # Earliest time at which a tick does more than let time pass
+        if self._tank >= self._inputs.ab * self._inputs.minerqty:
+            return self._time + self._inputs.tick_len
+        return min(
+            max(mining_start, self._last_artboost + self._inputs.rm_lag + 1),
+            self._last_genrich + self._inputs.genrich_cd,
+            self._max_time,
+        )
 
 
 class ContinuousMining(MiningStrategy):
+    def base_state(self) -> StrategyState:
+        # State after the base field setup, which only depends on
+        #   UserInput.base_field_key. BASE_STATE_CACHE shares it within a
+        #   process; pass it as base to untraced strategies elsewhere.
+        self._base_field_setup()
+        return self.snapshot()
+
     def _base_field_setup(self) -> None:
+        # Traced strategies set up their own, with its rows
+        if self._recording == Recording.NONE:
+            if self._shared_base is None:
+                self._shared_base = BASE_STATE_CACHE.get(self._inputs)
+            if self._shared_base is not None:
+                self.restore(self._shared_base)
+                self._set_base()
+                return
         # Write starting values
         self.write_all_data()
-        while self._time < self._inputs.genrich_start:
-            self.tick()
-            self.write_all_data()
+        self.idle(self.ticks_until(self._inputs.genrich_start))
         # First genrich
         self.genrich_and_write_data()
         self._status = MS.GENRICH
         # Write intermediate values
-        while self._time < self._inputs.genrich_start + self._inputs.genrich_cd:
-            self.tick()
-            self.write_all_data()
+        self.idle(self.ticks_until(
+            self._inputs.genrich_start + self._inputs.genrich_cd
+        ))
         # Second genrich
         self.genrich_and_write_data()
-        # Set as base values
+        self._set_base()
+        if self._recording == Recording.NONE:
+            BASE_STATE_CACHE.put(self._inputs, self.snapshot())
+
+    def _set_base(self) -> None:
         self._base_hf = self._hf.copy()
         self._base_time = self._time  # The same tick as 2nd genrich
-        self._base_mining_progress_data = self._mining_progress_data[:]
-        self._base_hydro_field_data = self._hydro_field_data[:]
+        self._base_trace_lengths = self.trace_lengths()
+        self._base_status_time = tuple(self._status_time)
     
-    def run(self) -> bool:
-        self._base_field_setup()
-        while self._mining_delay < self._max_mining_delay:
+    def _fork(self, mining_start: int) -> StrategyState | None:
+        # Latest untraced state from before mining started, which every
+        #   attempt starting to mine later shares
+        if self._recording != Recording.NONE:
+            return None
+        fork_time = max(
+            (time for time in self._snapshots if time < mining_start),
+            default=None,
+        )
+        return self._snapshots.get(fork_time)
+
+    def _attempt(self, delay: int) -> AO:
+        steps = self._attempt_steps(delay)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as result:
+                return result.value
+
+    def _attempt_all(self, delays: Sequence[int]) -> list[AO]:
+        # Outcomes of the delays up to the first that settles, each in its
+        #   own lane of a BatchMining engine from a copy of the base field.
+        #   The scalar state is left at the base.
+        from batch import OUTCOMES, BatchMining, FieldBatch
+        engine = BatchMining(
+            self._inputs,
+            FieldBatch.from_fields([self._base_hf] * len(delays)),
+            self._base_time,
+        )
+        codes, _ = engine.attempt(
+            np.arange(len(delays)), np.array(delays), first_settled=True
+        )
+        outcomes = []
+        for code in codes.tolist():
+            outcomes.append(OUTCOMES[code])
+            if outcomes[-1] != AO.DRAINED:
+                break
+        return outcomes
+
+    def _attempt_steps(self, delay: int) -> Generator[None, None, AO]:
+        # Pauses after each event tick, with its rows written
+        self._mining_delay = delay
+        mining_start = self._base_time + self._mining_delay
+        state = self._fork(mining_start)
+        if state is None:
             self._reset()
             self._status = MS.GENRICH
             self.get_new_rm_targets()
-            delay_reference = self._last_genrich
-            while self._time < self._max_time:
-                self.tick()
-                # TODO: Abstract away these components into MiningStrategy
-                #       superclass?
-                # Mine
-                if self._time >= delay_reference + self._mining_delay:
-                    if self._time > self._last_artboost + self._inputs.rm_lag:
-                        # Strictly greater since one tick passed after last
-                        #   artboost already
-                        self._status = MS.MINING
-                        total_mined = min(
-                            self._inputs.total_mining_speed,
-                            self._tank_max - self._tank
-                        )
-                        self._tank += total_mined
-                        self._hf.collect(total_mined, self._rm_targets)
-                    else:
-                        self._status = MS.WAITING
-                self.write_all_data()
-                # Boost and Move
-                if self._tank >= self._inputs.ab * self._inputs.minerqty:
-                    self._tank -= self._inputs.ab * self._inputs.minerqty
-                    self._boosts += self._inputs.minerqty
-                    self._last_artboost = self._time
-                    self.get_new_rm_targets()
-                    self.write_mining_progress_data()
-                # Enrich
-                if self._time >= self._last_genrich + self._inputs.genrich_cd:
-                    self.genrich_and_write_data()
-                    self._last_genrich = self._time
-                # Checks
-                if self._hf.drained_roid():
-                    # Retry
-                    break
-                if self._boosts >= self._inputs.boostqty:
-                    self.exit_miners()
-                    return True
-            else:
-                # Exceeded max simulation time
-                return False
-            # Increase delay
-            self._mining_delay += self._inputs.tick_len
-        
-        # Exceeded max mining delay
+        else:
+            self.restore(state)
+        while self._time < self._max_time:
+            # Jump to the tick of the next event
+            self.wait_until(
+                self.ticks_until(self.next_event(mining_start)) - 1,
+                mining_start,
+            )
+            if (
+                self._recording == Recording.NONE
+                and self.ticks_until(mining_start) == 1
+                and self._time not in self._snapshots
+            ):
+                # This attempt's history diverges from longer delays' here
+                self._snapshots[self._time] = self.snapshot()
+            self.tick()
+            self.check_in()
+            # TODO: Abstract away these components into MiningStrategy
+            #       superclass?
+            # Mine
+            if self._time >= mining_start:
+                if self._time > self._last_artboost + self._inputs.rm_lag:
+                    # Strictly greater since one tick passed after last
+                    #   artboost already
+                    self._status = MS.MINING
+                    total_mined = min(
+                        self._inputs.total_mining_speed,
+                        self._tank_max - self._tank
+                    )
+                    self._tank += total_mined
+                    self._hf.collect(total_mined, self._rm_targets)
+                else:
+                    self._status = MS.WAITING
+            self.write_all_data()
+            # Boost and Move
+            if self._tank >= self._inputs.ab * self._inputs.minerqty:
+                self._tank -= self._inputs.ab * self._inputs.minerqty
+                self._boosts += self._inputs.minerqty
+                self._last_artboost = self._time
+                self.get_new_rm_targets()
+                self.write_mining_progress_data()
+            # Enrich
+            if self._time >= self._last_genrich + self._inputs.genrich_cd:
+                self.genrich_and_write_data()
+                self._last_genrich = self._time
+            # Checks
+            if self._hf.drained_roid():
+                # Retry with a longer delay
+                return AO.DRAINED
+            if self._boosts >= self._inputs.boostqty:
+                self.exit_miners()
+                return AO.SUCCESS
+            yield
+        # Exceeded max simulation time
+        return AO.TIMEOUT
+
+    def _search_delay(self) -> int | None:
+        # Delay of the successful attempt, if any. Only the chosen attempt is
+        #   worth recording.
+        self._recording = Recording.NONE
+        if self._known_delay is None:
+            # Longer delays can't finish in time, and no delay can when the
+            #   build can't reach its target at all
+            limits = bounds(self._inputs)
+            delays = range(
+                0,
+                limits.max_delay + 1 if limits.feasible else 0,
+                self._inputs.tick_len,
+            )
+        else:
+            delays = [self._known_delay - self._inputs.tick_len]
+        self._search = DelaySearch(
+            self._attempt,
+            delays,
+            self._search_method,
+            attempt_all=self._attempt_all,
+        )
+        with timed(self._phase_times, "Search"):
+            delay = self._search.run() if delays else None
+        self._recording = self._trace_level
+        if delay is None:
+            # Exceeded max mining delay
+            self._mining_delay = self._max_mining_delay
+            return None
+        if self._search.outcome(delay) != AO.SUCCESS:
+            return None
+        return delay
+
+    def _pop_records(
+        self, stop: Callable[[TickRecord], bool] | None
+    ) -> Generator[TickRecord, None, bool]:
+        # Yields the progress rows recorded since the last call and drops
+        #   every trace. Returns whether stop accepted one of them.
+        columns = [
+            self._mining_progress_data[name].tolist()
+            for name in PROGRESS_COLUMNS
+        ]
+        self._mining_progress_data.truncate(0)
+        self._hydro_field_data.truncate(0)
+        self._status_time_data.truncate(0)
+        for time, boosts, tank, total_hydro, status in zip(*columns):
+            record = TickRecord(
+                time, boosts, tank, total_hydro, MINING_STATUSES[status]
+            )
+            yield record
+            if stop is not None and stop(record):
+                return True
         return False
+
+    def run(self) -> bool:
+        with timed(self._phase_times, "Base Setup"):
+            self._base_field_setup()
+        delay = self._search_delay()
+        if delay is None:
+            return False
+        if (
+            self._recording != Recording.NONE
+            or self._search_method == SM.BATCH
+            or self._mining_delay != delay
+        ):
+            with timed(self._phase_times, "Replay"):
+                self._search.replay(delay)
+        return True
+
+    def iter_ticks(
+        self, stop: Callable[[TickRecord], bool] | None = None
+    ) -> Generator[TickRecord, None, bool]:
+        # Progress records of the run as they are simulated, in place of its
+        #   traces. The base setup streams before the delay search and the
+        #   chosen attempt streams a tick at a time, only as fast as the
+        #   records are consumed. Records are not kept once yielded. Ends
+        #   after the first record stop accepts, e.g. to stop once boosts
+        #   reach a target. Returns whether the run finished successfully.
+        self._trace_level = self._recording = Recording.SUMMARY
+        with timed(self._phase_times, "Base Setup"):
+            self._base_field_setup()
+        if (yield from self._pop_records(stop)):
+            return False
+        delay = self._search_delay()
+        if delay is None:
+            return False
+        # The chosen attempt is replayed here instead of by the search
+        self._search.simulations += 1
+        steps = self._attempt_steps(delay)
+        for _ in steps:
+            if (yield from self._pop_records(stop)):
+                return False
+        yield from self._pop_records(stop)
+        return True
@@ -0,0 +1,90 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, fields, replace
+from itertools import product
+from typing import TYPE_CHECKING
+
+from enums import Recording
+from simulation import Simulation
+from strategies import ContinuousMining, MiningStrategy
+from userinput import UserInput
+
+if TYPE_CHECKING:
+    from pandas import DataFrame as df
+
+
+INPUT_COLUMNS = [field.name for field in fields(UserInput)]
+
+
+def sweep_inputs(base: UserInput,
+                 ranges: dict[str, Iterable[int]]) -> list[UserInput]:
+    # Cartesian product of the given UserInput fields around a base build
+    return [
+        replace(base, **dict(zip(ranges, values)))
+        for values in product(*ranges.values())
+    ]
+
+
+def simulate(inputs: UserInput,
+             mining_strategy: type[MiningStrategy] = ContinuousMining,
+             instrument: dict[str, bool] | None = None,
+             **options) -> dict[str, bool | int]:
+    # Options for Simulation.instrument add its stats to the summary, other
+    #   options go to the strategy
+    sim = Simulation(inputs)
+    if instrument is not None:
+        sim.instrument(**instrument)
+    sim.set_strategy(
+        mining_strategy, recording=Recording.NONE, **options
+    ).run()
+    if instrument is None:
+        return sim.summary()
+    return sim.summary() | {"Stats": sim.get_stats()}
+
+
+def iter_sweep(configs: Iterable[UserInput],
+               mining_strategy: type[MiningStrategy] = ContinuousMining,
+               max_workers: int | None = None,
+               instrument: dict[str, bool] | None = None,
+               ) -> Iterator[tuple[UserInput, dict[str, bool | int]]]:
+    # Yields results in the order they finish
+    if max_workers == 1:
+        for inputs in configs:
+            yield inputs, simulate(inputs, mining_strategy, instrument)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                simulate, inputs, mining_strategy, instrument
+            ): inputs
+            for inputs in configs
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def sweep(base: UserInput,
+          ranges: dict[str, Iterable[int]],
+          mining_strategy: type[MiningStrategy] = ContinuousMining,
+          max_workers: int | None = None,
+          done: "df | None" = None) -> "df":
+    # Configurations already in `done` are kept and not simulated again
+    from pandas import DataFrame as df
+    records = [] if done is None else done.to_dict("records")
+    computed = {
+        tuple(record[column] for column in INPUT_COLUMNS)
+        for record in records
+    }
+    configs = [
+        inputs for inputs in dict.fromkeys(sweep_inputs(base, ranges))
+        if tuple(asdict(inputs).values()) not in computed
+    ]
+    for inputs, summary in iter_sweep(configs, mining_strategy, max_workers):
+        records.append(asdict(inputs) | summary)
+    if not records:
+        return df(columns=INPUT_COLUMNS)
+    return (
+        df.from_records(records)
+        .sort_values(list(ranges))
+        .reset_index(drop=True)
+    )
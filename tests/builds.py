@@ -0,0 +1,42 @@
+from dataclasses import replace
+
+from userinput import UserInput
+
+
+# The app's default build, with a fixed starting field
+BASE_BUILD = UserInput(
+    drslv=10,
+    genlv=13,
+    enrlv=12,
+    ablv=13,
+    mboostlv=12,
+    remotelv=9,
+    minerlv=6,
+    minerqty=2,
+    boostqty=18,
+    _genrich_start_min=2,
+    exit_dur=80,
+    seed=0,
+)
+# Builds whose outcomes are not monotonic in the mining delay, so a delay
+#   which does not drain an asteroid comes before others which do
+NON_MONOTONIC_BUILDS = {
+    "drs9seed210": UserInput(
+        drslv=9, genlv=11, enrlv=15, ablv=12, mboostlv=13, remotelv=8,
+        minerlv=7, minerqty=4, boostqty=23, _genrich_start_min=4,
+        _genrich_lag=10, tick_len=5, _rmbug_lag=15, exit_dur=80, seed=210,
+    ),
+    "drs7seed981": UserInput(
+        drslv=7, genlv=4, enrlv=11, ablv=11, mboostlv=15, remotelv=2,
+        minerlv=7, minerqty=3, boostqty=15, _genrich_start_min=7,
+        _genrich_lag=28, tick_len=7, _rmbug_lag=21, exit_dur=74, seed=981,
+    ),
+}
+BUILDS = {
+    "default": BASE_BUILD,
+    "drs7x1": replace(BASE_BUILD, drslv=7, minerqty=1),
+    "drs12x4tick5": replace(BASE_BUILD, drslv=12, minerqty=4, tick_len=5),
+    "rmbug": replace(BASE_BUILD, minerlv=6, ablv=14, _rmbug_lag=20),
+    "invalid": replace(BASE_BUILD, boostqty=25, minerlv=3, remotelv=2),
+    **NON_MONOTONIC_BUILDS,
+}
@@ -0,0 +1,9 @@
+import pytest
+
+from tests.builds import BUILDS
+from userinput import UserInput
+
+
+@pytest.fixture(params=list(BUILDS.values()), ids=list(BUILDS))
+def build(request) -> UserInput:
+    return request.param
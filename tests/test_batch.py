@@ -0,0 +1,27 @@
+from dataclasses import replace
+
+import numpy as np
+
+from batch import BatchSimulation
+from enums import Recording
+from simulation import Simulation
+from strategies import ContinuousMining
+
+
+RESULT_COLUMNS = ["Mining Delay", "Last Boost Time", "Exit Time"]
+
+
+def test_matches_continuous_mining(build):
+    seeds = [build.seed, 1, 2, 3]
+    results = BatchSimulation(build, seeds).run().read_results()
+    for seed, row in zip(seeds, results.to_dict("records")):
+        sim = Simulation(replace(build, seed=seed)).set_strategy(
+            ContinuousMining, recording=Recording.NONE
+        ).run()
+        assert row["Valid"] == sim.valid
+        summary = sim.summary()
+        for column in RESULT_COLUMNS:
+            if sim.valid:
+                assert row[column] == summary[column]
+            else:
+                assert np.isnan(row[column])
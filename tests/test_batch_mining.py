@@ -0,0 +1,36 @@
+import numpy as np
+
+from batch import OUTCOMES, BatchMining, FieldBatch
+from enums import AttemptOutcome as AO
+from enums import Recording
+from strategies import ContinuousMining
+
+
+def test_lanes_match_scalar_attempts(build):
+    strategy = ContinuousMining(build, recording=Recording.NONE)
+    strategy.base_state()
+    delays = np.arange(0, 2 * build.genrich_cd, build.tick_len)
+    engine = BatchMining(
+        build,
+        FieldBatch.from_fields([strategy._base_hf] * len(delays)),
+        strategy._base_time,
+    )
+    codes, completed = engine.attempt(np.arange(len(delays)), delays)
+    for delay, code, time in zip(delays.tolist(), codes, completed):
+        outcome = strategy._attempt(delay)
+        assert OUTCOMES[code] == outcome, delay
+        if outcome == AO.SUCCESS:
+            assert time == strategy.get_last_boost_time(), delay
+
+
+def test_first_settled_matches_all_lanes(build):
+    strategy = ContinuousMining(build, recording=Recording.NONE)
+    strategy.base_state()
+    delays = list(range(0, 2 * build.genrich_cd, build.tick_len))
+    outcomes = [strategy._attempt(delay) for delay in delays]
+    first = next(
+        (pos for pos, outcome in enumerate(outcomes)
+         if outcome != AO.DRAINED),
+        len(delays) - 1,
+    )
+    assert strategy._attempt_all(delays) == outcomes[:first + 1]
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+import strategies
+from bounds import Bounds, bounds, earliest_completions
+from enums import Recording
+from simulation import Simulation
+from strategies import ContinuousMining
+from tests.builds import BUILDS
+from userinput import UserInput
+
+
+def random_builds(count: int) -> dict[str, UserInput]:
+    # Every level the app offers, with and without the remote mining bug
+    rng = np.random.default_rng(25)
+    builds = {}
+    for seed in range(count):
+        tick_len = int(rng.choice([5, 7, 10, 20, 25]))
+        builds[f"random{seed}"] = UserInput(
+            drslv=int(rng.integers(7, 13)),
+            genlv=int(rng.integers(0, 16)),
+            enrlv=int(rng.integers(0, 16)),
+            ablv=int(rng.integers(0, 16)),
+            mboostlv=int(rng.integers(0, 16)),
+            remotelv=int(rng.integers(1, 16)),
+            minerlv=int(rng.integers(1, 8)),
+            minerqty=int(rng.integers(1, 5)),
+            boostqty=int(rng.integers(1, 26)),
+            _genrich_start_min=int(rng.integers(0, 10)),
+            _genrich_lag=tick_len * int(rng.integers(0, 5)),
+            tick_len=tick_len,
+            _rmbug_lag=tick_len * int(rng.integers(0, 5)),
+            exit_dur=80,
+            seed=seed,
+        )
+    return builds
+
+
+BOUNDS_BUILDS = BUILDS | random_builds(100)
+
+
+def unbounded(inputs: UserInput) -> Bounds:
+    # Every delay, as if nothing were known
+    return Bounds(
+        max_hydro=np.inf,
+        max_boosts=inputs.boostqty,
+        earliest_completion=0,
+        max_delay=2 * inputs.genrich_cd - 1,
+        feasible=True,
+    )
+
+
+def run(inputs: UserInput) -> Simulation:
+    return Simulation(inputs).set_strategy(
+        ContinuousMining, recording=Recording.NONE
+    ).run()
+
+
+@pytest.mark.parametrize("inputs", BOUNDS_BUILDS.values(), ids=BOUNDS_BUILDS)
+def test_bounds_hold(inputs, monkeypatch):
+    limits = bounds(inputs)
+    bounded = run(inputs)
+    monkeypatch.setattr(strategies, "bounds", unbounded)
+    sim = run(inputs)
+    assert bounded.valid == sim.valid
+    if not sim.valid:
+        return
+    summary = sim.summary()
+    delay = summary["Mining Delay"] - inputs.tick_len
+    assert limits.feasible
+    assert limits.max_boosts >= inputs.boostqty
+    assert delay <= limits.max_delay
+    assert summary["Last Boost Time"] >= earliest_completions(
+        inputs, np.array([delay])
+    )[0]
+    del summary["Simulations"]
+    assert {
+        name: value for name, value in bounded.summary().items()
+        if name != "Simulations"
+    } == summary
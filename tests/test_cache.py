@@ -0,0 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from cache import SimulationCache
+from enums import Recording
+from strategies import BaseStateCache, ContinuousMining, StrategyState
+from tests.builds import BASE_BUILD
+
+
+def test_shared_between_threads():
+    builds = [replace(BASE_BUILD, boostqty=qty) for qty in range(10, 16)]
+    cache = SimulationCache(max_bytes=20 * 2**10)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sims = list(executor.map(
+            lambda inputs: cache.run(
+                inputs, ContinuousMining, recording=Recording.SUMMARY
+            ),
+            builds * 8,
+        ))
+    stats = cache.stats()
+    assert stats["Hits"] + stats["Misses"] == len(sims)
+    assert stats["Bytes"] == sum(
+        nbytes for _, nbytes in cache._entries.values()
+    )
+    assert 0 < stats["Bytes"] <= 20 * 2**10
+
+
+def test_base_states_shared_between_threads():
+    cache = BaseStateCache(max_entries=4)
+    builds = [replace(BASE_BUILD, seed=seed) for seed in range(8)]
+    states = {
+        inputs: ContinuousMining(inputs).base_state() for inputs in builds
+    }
+
+    def share(inputs) -> StrategyState:
+        cache.put(inputs, states[inputs])
+        return cache.get(inputs)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(share, builds * 50))
+    assert cache.stats()["Entries"] == 4
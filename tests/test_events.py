@@ -0,0 +1,32 @@
+import numpy as np
+
+from enums import Recording
+from simulation import Simulation
+from strategies import ContinuousMining, MiningStrategy
+
+
+def stepped_idle(self, ticks: int) -> None:
+    # Every tick in turn, as before idle ticks were jumped over
+    for _ in range(ticks):
+        self.tick()
+        self.write_all_data()
+
+
+def next_tick(self, mining_start: int) -> int:
+    return self._time + self._inputs.tick_len
+
+
+def run(inputs) -> dict[str, np.ndarray]:
+    return Simulation(inputs).set_strategy(
+        ContinuousMining, recording=Recording.FULL
+    ).run().to_arrays()
+
+
+def test_matches_stepping_every_tick(build, monkeypatch):
+    jumped = run(build)
+    monkeypatch.setattr(MiningStrategy, "idle", stepped_idle)
+    monkeypatch.setattr(MiningStrategy, "next_event", next_tick)
+    stepped = run(build)
+    assert jumped.keys() == stepped.keys()
+    for name in jumped:
+        np.testing.assert_array_equal(jumped[name], stepped[name], name)
@@ -0,0 +1,69 @@
+from math import floor
+
+import numpy as np
+import pytest
+
+from constants import *
+from strategies import HydroField
+
+
+class ListField:
+    # HydroField as plain lists, as it was before numpy
+    def __init__(self, roids: list[float]) -> None:
+        self.roids = list(roids)
+        self.collected = [0 for _ in range(MAX_ROIDS)]
+        self.gen_counter = 0
+
+    def genrich(self, gen_amt: int, enr_mult: float) -> None:
+        new_roid_amt = gen_amt // GENESIS_ROIDS
+        cur_roids = START_ROIDS + self.gen_counter
+        if cur_roids < MAX_ROIDS:
+            new_roids = min(GENESIS_ROIDS, MAX_ROIDS - cur_roids)
+            self.roids[cur_roids:cur_roids+new_roids] = (
+                [new_roid_amt for _ in range(new_roids)]
+            )
+            self.gen_counter += new_roids
+        self.roids = [min(floor(r * enr_mult), H_MAX) for r in self.roids]
+        self.collected = [0 for _ in range(MAX_ROIDS)]
+
+    def sort_rm_targets(self, count: int) -> list[int]:
+        return [
+            idx for idx, value in sorted(
+                enumerate(self.roids), key=lambda x: x[1], reverse=True
+            )
+        ][:count]
+
+    def collect(self, total_amt: float, rm_targets: list[int]) -> None:
+        amt_per_roid = total_amt / len(rm_targets)
+        for idx in rm_targets:
+            self.collected[idx] += min(self.roids[idx], amt_per_roid)
+            self.roids[idx] -= min(self.roids[idx], amt_per_roid)
+
+    def drained_roid(self) -> bool:
+        return all([
+            self.gen_counter == MAX_ROIDS - START_ROIDS,
+            min(self.roids) == 0
+        ])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_lists(seed):
+    rng = np.random.default_rng(seed)
+    hf = HydroField(DRS_STARTING_HYDRO[rng.integers(7, 13)], rng)
+    reference = ListField(hf.roids.tolist())
+    for _ in range(300):
+        if rng.random() < 0.05:
+            gen_amt = int(GENESIS[rng.integers(0, 16)])
+            enr_mult = float(ENRICH[rng.integers(0, 16)])
+            hf.genrich(gen_amt, enr_mult)
+            reference.genrich(gen_amt, enr_mult)
+        count = int(rng.integers(1, MAX_ROIDS + 1))
+        targets = hf.sort_rm_targets(count)
+        assert targets.tolist() == reference.sort_rm_targets(count)
+        total_amt = float(rng.uniform(0, 200))
+        hf.collect(total_amt, targets)
+        reference.collect(total_amt, targets.tolist())
+        assert hf.roids.tolist() == reference.roids
+        assert hf.collected.tolist() == reference.collected
+        assert hf.total_hydro == sum(reference.roids)
+        assert hf.drained_roid() == reference.drained_roid()
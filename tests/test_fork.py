@@ -0,0 +1,22 @@
+import numpy as np
+
+from enums import Recording
+from simulation import Simulation
+from strategies import ContinuousMining
+
+
+def run(inputs) -> dict[str, np.ndarray]:
+    return Simulation(inputs).set_strategy(
+        ContinuousMining, recording=Recording.NONE
+    ).run().to_arrays()
+
+
+def test_matches_attempts_from_the_start(build, monkeypatch):
+    forked = run(build)
+    monkeypatch.setattr(
+        ContinuousMining, "_fork", lambda self, mining_start: None
+    )
+    unforked = run(build)
+    assert forked.keys() == unforked.keys()
+    for name in forked:
+        np.testing.assert_array_equal(forked[name], unforked[name], name)
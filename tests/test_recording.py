@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from enums import Recording
+from simulation import Simulation
+from strategies import ContinuousMining
+
+
+def run(inputs, recording: Recording) -> dict[str, np.ndarray]:
+    arrays = Simulation(inputs).set_strategy(
+        ContinuousMining, recording=recording
+    ).run().to_arrays()
+    # Untraced runs skip replaying the chosen attempt when it ran last
+    del arrays["simulations"]
+    return arrays
+
+
+@pytest.mark.parametrize("recording", [Recording.NONE, Recording.SUMMARY])
+def test_matches_full(build, recording):
+    full = run(build, Recording.FULL)
+    arrays = run(build, recording)
+    untraced = ("field_",)
+    if recording == Recording.NONE:
+        untraced += ("progress_", "status_time_")
+    for name in full:
+        if name.startswith(untraced):
+            assert len(arrays[name]) == 0, name
+        else:
+            np.testing.assert_array_equal(arrays[name], full[name], name)
+
+
+def test_counts_rows_dropped_while_streaming(build):
+    sim = Simulation(build).set_strategy(ContinuousMining)
+    records = list(sim.iter_ticks())
+    counters = sim.get_stats()["Counters"]
+    assert counters["Progress Rows Kept"] == 0
+    assert counters["Progress Rows Written"] == len(records)
@@ -0,0 +1,74 @@
+import pytest
+
+from delaysearch import DelaySearch
+from enums import AttemptOutcome as AO
+from enums import Recording
+from enums import SearchMethod as SM
+from simulation import Simulation
+from strategies import ContinuousMining
+from tests.builds import NON_MONOTONIC_BUILDS
+
+
+def run(inputs, search_method: SM) -> Simulation:
+    return Simulation(inputs).set_strategy(
+        ContinuousMining,
+        search_method=search_method,
+        recording=Recording.NONE,
+    ).run()
+
+
+def results(sim: Simulation) -> dict[str, bool | int]:
+    summary = sim.summary()
+    del summary["Simulations"]
+    if not summary["Valid"]:
+        return {"Valid": False}
+    return summary
+
+
+@pytest.mark.parametrize("search_method", list(SM))
+def test_matches_linear(build, search_method):
+    assert (
+        results(run(build, search_method)) == results(run(build, SM.LINEAR))
+    )
+
+
+@pytest.mark.parametrize("search_method", list(SM))
+@pytest.mark.parametrize("inputs", NON_MONOTONIC_BUILDS.values(),
+                         ids=NON_MONOTONIC_BUILDS)
+def test_non_monotonic_builds_are_valid(inputs, search_method):
+    assert run(inputs, search_method).valid
+
+
+@pytest.mark.parametrize("search_method", list(SM))
+def test_unprobed_settled_delay(search_method):
+    # One delay settles well below the settled tail
+    outcomes = [AO.DRAINED] * 40 + [AO.SUCCESS] * 24
+    outcomes[13] = AO.TIMEOUT
+    search = DelaySearch(
+        lambda delay: outcomes[delay],
+        range(len(outcomes)),
+        search_method,
+        attempt_all=lambda delays: [outcomes[delay] for delay in delays],
+    )
+    assert search.run() == 13
+
+
+@pytest.mark.parametrize("search_method", list(SM))
+def test_no_settled_delay(search_method):
+    outcomes = [AO.DRAINED] * 20
+    search = DelaySearch(
+        lambda delay: outcomes[delay],
+        range(len(outcomes)),
+        search_method,
+        attempt_all=lambda delays: [outcomes[delay] for delay in delays],
+    )
+    assert search.run() is None
+
+
+def test_batch_counts_lanes_that_ran(build):
+    # The same attempts as the linear scan, plus the replay of the chosen
+    #   delay when there is one
+    linear = run(build, SM.LINEAR).summary()
+    batch = run(build, SM.BATCH).summary()
+    replays = 1 if batch["Valid"] else 0
+    assert batch["Simulations"] == linear["Simulations"] + replays
@@ -0,0 +1,37 @@
+from enums import MiningStatus as MS
+from enums import Recording
+from simulation import Simulation
+from strategies import PROGRESS_COLUMNS, ContinuousMining, TickRecord
+
+
+def summary_records(inputs) -> list[TickRecord]:
+    sim = Simulation(inputs).set_strategy(
+        ContinuousMining, recording=Recording.SUMMARY
+    ).run()
+    progress = sim.to_arrays()
+    columns = [progress[f"progress_{name}"] for name in PROGRESS_COLUMNS]
+    return [
+        TickRecord(time, boosts, tank, total_hydro, list(MS)[status])
+        for time, boosts, tank, total_hydro, status in zip(
+            *(column.tolist() for column in columns)
+        )
+    ]
+
+
+def stream(inputs, **kwargs) -> list[TickRecord]:
+    sim = Simulation(inputs).set_strategy(ContinuousMining)
+    return list(sim.iter_ticks(**kwargs))
+
+
+def test_matches_summary_trace(build):
+    assert stream(build) == summary_records(build)
+
+
+def test_stops_after_accepted_record(build):
+    records = summary_records(build)
+    target = max(record.boosts for record in records) // 2
+    streamed = stream(build, stop=lambda record: record.boosts >= target)
+    first = next(
+        pos for pos, record in enumerate(records) if record.boosts >= target
+    )
+    assert streamed == records[:first + 1]
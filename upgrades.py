@@ -0,0 +1,112 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from constants import *
+from enums import Recording
+from seeds import spawn_seeds
+from strategies import ContinuousMining
+from sweep import simulate
+from userinput import UserInput
+
+if TYPE_CHECKING:
+    from pandas import DataFrame as df
+
+
+# Upgrades by their name in the app, as the UserInput field and its max level
+UPGRADES = {
+    "Mining Boost": ("mboostlv", len(MINING_BOOST) - 1),
+    "Remote Mining": ("remotelv", len(REMOTE_MINING) - 1),
+    "Genesis": ("genlv", len(GENESIS) - 1),
+    "Enrich": ("enrlv", len(ENRICH) - 1),
+    "Artifact Boost": ("ablv", len(ARTIFACT_BOOST) - 1),
+    "Miner Level": ("minerlv", len(MINER_SPEED) - 1),
+    "Miner Quantity": ("minerqty", MAX_MINERS),
+}
+
+
+def upgrade_candidates(inputs: UserInput) -> dict[str, UserInput]:
+    # Every build one level above the given one, skipping maxed upgrades
+    return {
+        name: replace(inputs, **{field: getattr(inputs, field) + 1})
+        for name, (field, max_level) in UPGRADES.items()
+        if getattr(inputs, field) < max_level
+    }
+
+
+def rank_upgrades(inputs: UserInput,
+                  max_workers: int | None = None,
+                  executor: Executor | None = None) -> "df":
+    # Single-level upgrades by the boost time and mining delay they save,
+    #   best first. Every build mines the same field, so an unseeded build
+    #   is given a seed. Builds run on the executor when given, like the
+    #   app's shared one, or else on a new process pool.
+    from pandas import DataFrame as df
+    if inputs.seed is None:
+        inputs = replace(inputs, seed=spawn_seeds(None, 1)[0])
+    builds = {"Current": inputs} | upgrade_candidates(inputs)
+    # Only Genesis and Enrich change the base field setup
+    bases = {}
+    for build in builds.values():
+        if build.base_field_key not in bases:
+            bases[build.base_field_key] = ContinuousMining(
+                build, recording=Recording.NONE
+            ).base_state()
+    if max_workers == 1 and executor is None:
+        summaries = {
+            name: simulate(build, base=bases[build.base_field_key])
+            for name, build in builds.items()
+        }
+    else:
+        with (
+            nullcontext(executor) if executor is not None
+            else ProcessPoolExecutor(max_workers=max_workers)
+        ) as pool:
+            futures = {
+                name: pool.submit(
+                    simulate, build, base=bases[build.base_field_key]
+                )
+                for name, build in builds.items()
+            }
+            summaries = {
+                name: future.result() for name, future in futures.items()
+            }
+
+    current = summaries.pop("Current")
+    records = []
+    for name, summary in summaries.items():
+        field, _ = UPGRADES[name]
+        valid = summary["Valid"]
+        record = {
+            "Upgrade": name,
+            "Level": getattr(builds[name], field),
+            "Valid": valid,
+        }
+        for column in ["Mining Delay", "Last Boost Time", "Exit Time"]:
+            record[column] = summary[column] if valid else np.nan
+        records.append(record)
+    results = df.from_records(records, columns=[
+        "Upgrade", "Level", "Valid",
+        "Mining Delay", "Last Boost Time", "Exit Time",
+    ])
+    if current["Valid"]:
+        results["Boost Time Saved"] = (
+            current["Last Boost Time"] - results["Last Boost Time"]
+        )
+        results["Delay Saved"] = (
+            current["Mining Delay"] - results["Mining Delay"]
+        )
+    else:
+        results["Boost Time Saved"] = np.nan
+        results["Delay Saved"] = np.nan
+    return (
+        results
+        .sort_values(
+            ["Valid", "Boost Time Saved", "Delay Saved", "Last Boost Time"],
+            ascending=[False, False, False, True],
+        )
+        .reset_index(drop=True)
+    )
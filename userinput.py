@@ -20,6 +20,8 @@ class UserInput:
     tick_len: int = 10
     _rmbug_lag: int = 0
     exit_dur: int
+    # Starting field seed, None draws a fresh random field
+    seed: int | None = None
 
     @property
     def gen(self) -> int:
@@ -66,3 +68,11 @@ class UserInput:
             return self._rmbug_lag
         else:
             return 0
+
+    @property
+    def base_field_key(self) -> tuple:
+        # Everything the field depends on up to the second genrich
+        return (
+            self.drslv, self.seed, self.gen, self.enr,
+            self.genrich_start, self.genrich_cd, self.tick_len,
+        )